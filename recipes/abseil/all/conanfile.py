@@ -5,6 +5,7 @@ from conan.tools.build import check_min_cppstd, cross_building
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, get, load, replace_in_file, rmdir, save
 from conan.tools.microsoft import is_msvc
+from conan.tools.scm import Version
 import json
 import os
 import re
@@ -25,10 +26,22 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "use_std_any": ["auto", True, False],
+        "use_std_optional": ["auto", True, False],
+        "use_std_string_view": ["auto", True, False],
+        "use_std_variant": ["auto", True, False],
+        "hardened": [True, False],
+        "random_hwaes": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "use_std_any": "auto",
+        "use_std_optional": "auto",
+        "use_std_string_view": "auto",
+        "use_std_variant": "auto",
+        "hardened": False,
+        "random_hwaes": True,
     }
 
     short_paths = True
@@ -38,9 +51,15 @@ class AbseilConan(ConanFile):
         for p in self.conan_data.get("patches", {}).get(self.version, []):
             copy(self, p["patch_file"], self.recipe_folder, self.export_sources_folder)
 
+    @property
+    def _std_options(self):
+        return ["use_std_any", "use_std_optional", "use_std_string_view", "use_std_variant"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "20211102.0":
+            del self.options.hardened
 
     def configure(self):
         if self.options.shared:
@@ -52,6 +71,10 @@ class AbseilConan(ConanFile):
         if self.info.options.shared and is_msvc(self):
             # upstream tries its best to export symbols, but it's broken for the moment
             raise ConanInvalidConfiguration("abseil shared not availabe for Visual Studio (yet)")
+        if self.info.settings.compiler.cppstd:
+            for option in self._std_options:
+                if self.info.options.get_safe(option) == True:
+                    check_min_cppstd(self, 17)
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -67,6 +90,12 @@ class AbseilConan(ConanFile):
         tc.variables["BUILD_TESTING"] = False
         # We force CMP0067 policy to NEW for our abi trick in _patch_sources()
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0067"] = "NEW"
+        # Forced ABSL_OPTION_USE_STD_* values are pre-seeded in the cache, so that
+        # check_cxx_source_compiles() of our abi trick skips the detection
+        for option in self._std_options:
+            value = self.options.get_safe(option)
+            if value != "auto":
+                tc.cache_variables[option.upper()] = bool(value)
         if is_msvc(self):
             # see https://github.com/abseil/abseil-cpp/issues/649
             tc.preprocessor_definitions["_HAS_DEPRECATED_RESULT_OF"] = 1
@@ -93,6 +122,16 @@ class AbseilConan(ConanFile):
         """)
         save(self, cmakelists, abi_trick_block, append=True)
 
+        if self.options.get_safe("hardened"):
+            replace_in_file(self, os.path.join(self.source_folder, "absl", "base", "options.h"),
+                            "#define ABSL_OPTION_HARDENED 0",
+                            "#define ABSL_OPTION_HARDENED 1")
+
+        if not self.options.random_hwaes:
+            # Compile randen_hwaes without AES-NI/ARMv8 crypto flags, it then falls back to the portable randen
+            save(self, os.path.join(self.source_folder, "absl", "copts", "AbseilConfigureCopts.cmake"),
+                 "\nset(ABSL_RANDOM_RANDEN_COPTS \"\")\n", append=True)
+
     def build(self):
         self._patch_sources()
         cmake = CMake(self)
@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.files import copy, get
 from conan.tools.layout import basic_layout
+from conan.tools.scm import Version
 import os
 
 required_conan_version = ">=1.50.0"
@@ -14,11 +16,37 @@ class Asio(ConanFile):
     topics = ("asio", "network", "io", "low-level")
     license = "BSL-1.0"
     settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_io_uring": [True, False],
+        "io_uring_as_default": [True, False],
+        "disable_threads": [True, False],
+    }
+    default_options = {
+        "with_io_uring": False,
+        "io_uring_as_default": False,
+        "disable_threads": False,
+    }
     no_copy_source = True
 
+    def config_options(self):
+        # io_uring is a Linux only interface
+        if self.settings.os != "Linux":
+            del self.options.with_io_uring
+            del self.options.io_uring_as_default
+
+    def requirements(self):
+        if self.options.get_safe("with_io_uring"):
+            self.requires("liburing/2.2")
+
     def package_id(self):
         self.info.clear()
 
+    def validate(self):
+        if self.options.get_safe("with_io_uring") and Version(self.version) < "1.21.0":
+            raise ConanInvalidConfiguration("Asio supports io_uring since 1.21.0")
+        if self.options.get_safe("io_uring_as_default") and not self.options.with_io_uring:
+            raise ConanInvalidConfiguration("io_uring_as_default requires with_io_uring=True")
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
@@ -43,5 +71,13 @@ class Asio(ConanFile):
         self.cpp_info.frameworkdirs = []
         self.cpp_info.libdirs = []
         self.cpp_info.resdirs = []
-        if self.settings.os in ["Linux", "FreeBSD"]:
+        if self.options.get_safe("with_io_uring"):
+            self.cpp_info.defines.append("ASIO_HAS_IO_URING")
+        if self.options.get_safe("io_uring_as_default"):
+            # io_uring replaces epoll as the reactor backend
+            self.cpp_info.defines.append("ASIO_HAS_IO_URING_AS_DEFAULT")
+        if self.options.disable_threads:
+            # No locking in io_context and strands, for single-threaded programs only
+            self.cpp_info.defines.append("ASIO_DISABLE_THREADS")
+        elif self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.append("pthread")
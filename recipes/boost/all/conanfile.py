@@ -13,6 +13,7 @@ import re
 import sys
 import shlex
 import shutil
+import time
 import yaml
 
 try:
@@ -94,9 +95,13 @@ class BoostConan(ConanFile):
         "lzma": [True, False],
         "zstd": [True, False],
         "segmented_stacks": [True, False],
+        "context_impl": [None, "fcontext", "ucontext", "winfib"],
+        "with_io_uring": [True, False],
         "debug_level": list(range(0, 14)),
         "pch": [True, False],
         "extra_b2_flags": "ANY",  # custom b2 flags
+        "compiler_launcher": "ANY",  # e.g. ccache or sccache, to reuse objects across builds
+        "per_library_build": [True, False],  # one b2 invocation per library, with a build time report
         "i18n_backend": ["iconv", "icu", None, "deprecated"],
         "i18n_backend_iconv": ["libc", "libiconv", "off"],
         "i18n_backend_icu": [True, False],
@@ -132,9 +137,13 @@ class BoostConan(ConanFile):
         "lzma": False,
         "zstd": False,
         "segmented_stacks": False,
+        "context_impl": None,
+        "with_io_uring": False,
         "debug_level": 0,
         "pch": True,
         "extra_b2_flags": "None",
+        "compiler_launcher": None,
+        "per_library_build": False,
         "i18n_backend": "deprecated",
         "i18n_backend_iconv": "libc",
         "i18n_backend_icu": False,
@@ -270,6 +279,10 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        # io_uring is a Linux only interface
+        if self.settings.os != "Linux":
+            del self.options.with_io_uring
+
         # nowide requires a c++11-able compiler + movable std::fstream: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         # json requires a c++11-able compiler: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         if self.settings.compiler.cppstd:
@@ -409,6 +422,9 @@ class BoostConan(ConanFile):
         if self.options.without_fiber:
             del self.options.numa
 
+        if self.options.get_safe("without_context", True):
+            del self.options.context_impl
+
     def validate(self):
         if not self.options.multithreading:
             # * For the reason 'thread' is deactivate look at https://stackoverflow.com/a/20991533
@@ -419,6 +435,20 @@ class BoostConan(ConanFile):
                 if not self.options.get_safe(f"without_{lib}"):
                     raise ConanInvalidConfiguration(f"Boost '{lib}' library requires multi threading")
 
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "winfib" and not self._is_windows_platform:
+            raise ConanInvalidConfiguration("context_impl=winfib is only available on Windows")
+        if context_impl == "ucontext" and self._is_windows_platform:
+            raise ConanInvalidConfiguration("context_impl=ucontext is not available on Windows")
+        if self.options.segmented_stacks and context_impl not in (None, "ucontext"):
+            raise ConanInvalidConfiguration("segmented_stacks requires context_impl=ucontext")
+
+        if self.options.get_safe("with_io_uring") and Version(self.version) < "1.78.0":
+            raise ConanInvalidConfiguration("Boost.Asio supports io_uring since boost 1.78.0")
+
+        if self.options.compiler_launcher and (self._is_msvc or self._is_clang_cl):
+            raise ConanInvalidConfiguration("compiler_launcher is not supported with msvc and clang-cl toolsets")
+
         if self._is_msvc and self._shared and "MT" in msvc_runtime_flag(self):
             raise ConanInvalidConfiguration("Boost can not be built as shared library with MT runtime.")
 
@@ -546,6 +576,8 @@ class BoostConan(ConanFile):
             self.requires("icu/71.1")
         if self._with_iconv:
             self.requires("libiconv/1.17")
+        if self.options.get_safe("with_io_uring"):
+            self.requires("liburing/2.2")
 
     def package_id(self):
         del self.info.options.i18n_backend
@@ -557,6 +589,8 @@ class BoostConan(ConanFile):
             del self.info.options.debug_level
             del self.info.options.filesystem_version
             del self.info.options.pch
+            del self.info.options.compiler_launcher
+            del self.info.options.per_library_build
             del self.info.options.python_executable  # PATH to the interpreter is not important, only version matters
             if self.options.without_python:
                 del self.info.options.python_version
@@ -861,6 +895,9 @@ class BoostConan(ConanFile):
         # Help locating bzip2 and zlib
         self._create_user_config_jam(self._boost_build_dir)
 
+        if self.options.compiler_launcher and self.options.pch:
+            self.output.warn("precompiled headers are usually not cacheable by compiler launchers, consider pch=False")
+
         # JOIN ALL FLAGS
         b2_flags = " ".join(self._build_flags)
         full_command = f"{self._b2_exe} {b2_flags}"
@@ -876,7 +913,54 @@ class BoostConan(ConanFile):
             with chdir(self, sources):
                 # To show the libraries *1
                 # self.run("%s --show-libraries" % b2_exe)
-                self.run(full_command, run_environment=True)
+                if self.options.per_library_build:
+                    self._run_b2_per_library(full_command)
+                else:
+                    self.run(full_command, run_environment=True)
+
+    @property
+    def _b2_libraries(self):
+        return [libname for libname in self._configure_options if not getattr(self.options, f"without_{libname}")]
+
+    @property
+    def _b2_libraries_build_order(self):
+        """Enabled libraries, sorted such that every library comes after the libraries it depends on"""
+        libraries = self._b2_libraries
+        ordered = []
+        visited = set()
+
+        def visit(name):
+            if name in visited:
+                return
+            visited.add(name)
+            for dependency in self._dependencies["dependencies"].get(name, []):
+                visit(dependency)
+            if name in libraries:
+                ordered.append(name)
+
+        for libname in libraries:
+            visit(libname)
+        return ordered
+
+    def _run_b2_per_library(self, command):
+        libraries = self._b2_libraries_build_order
+        if not libraries:
+            # Header-only selection: a single invocation still runs the install step copying the headers
+            self.run(command, run_environment=True)
+            return
+
+        # All invocations share the same build dir, so objects of libraries built earlier are reused
+        durations = []
+        for libname in libraries:
+            self.output.info(f"Building Boost.{libname}")
+            start = time.perf_counter()
+            self.run(f"{command} --with-{libname}", run_environment=True)
+            durations.append((libname, time.perf_counter() - start))
+
+        report = "\n".join(f"{libname:<20} {duration:>8.1f}s" for libname, duration in durations)
+        report += f"\n{'total':<20} {sum(d for _, d in durations):>8.1f}s\n"
+        save(self, os.path.join(self.build_folder, "boost_build_times.txt"), report)
+        self.output.info(f"Boost build times:\n{report}")
 
     @property
     def _b2_os(self):
@@ -1033,8 +1117,8 @@ class BoostConan(ConanFile):
         else:
             flags.append("variant=release")
 
-        for libname in self._configure_options:
-            if not getattr(self.options, f"without_{libname}"):
+        if not self.options.per_library_build:
+            for libname in self._b2_libraries:
                 flags.append(f"--with-{libname}")
 
         flags.append(f"toolset={self._toolset}")
@@ -1086,6 +1170,13 @@ class BoostConan(ConanFile):
             flags.extend(["segmented-stacks=on",
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl:
+            flags.append(f"context-impl={context_impl}")
+            if context_impl == "ucontext" and not self.options.segmented_stacks:
+                flags.append("define=BOOST_USE_UCONTEXT=1")
+            elif context_impl == "winfib":
+                flags.append("define=BOOST_USE_WINFIB=1")
         flags.append("pch=on" if self.options.pch else "pch=off")
 
         if is_apple_os(self):
@@ -1245,7 +1336,14 @@ class BoostConan(ConanFile):
         if self._is_msvc:
             contents += f' "{cxx_fwd_slahes}"'
         else:
-            contents += f' {cxx_fwd_slahes}'
+            if self.options.compiler_launcher:
+                # b2 would otherwise take the launcher for the compiler itself
+                if not cxx_fwd_slahes:
+                    raise ConanInvalidConfiguration("compiler_launcher requires a compiler path, set the CXX environment variable")
+                launcher_fwd_slashes = str(self.options.compiler_launcher).replace("\\", "/")
+                contents += f' "{launcher_fwd_slashes}"'
+            if cxx_fwd_slahes:
+                contents += f' "{cxx_fwd_slahes}"'
 
         if is_apple_os(self):
             if self.settings.compiler == "apple-clang":
@@ -1453,6 +1551,14 @@ class BoostConan(ConanFile):
 
         if self.options.segmented_stacks:
             self.cpp_info.components["headers"].defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
+        elif self.options.get_safe("context_impl") == "ucontext":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_UCONTEXT")
+        if self.options.get_safe("context_impl") == "winfib":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_WINFIB")
+
+        if self.options.get_safe("with_io_uring"):
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_HAS_IO_URING")
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
 
         if self.options.system_use_utf8:
             self.cpp_info.components["headers"].defines.append("BOOST_SYSTEM_USE_UTF8")
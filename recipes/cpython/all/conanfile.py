@@ -1,6 +1,7 @@
 from conans import AutoToolsBuildEnvironment, ConanFile, MSBuild, tools
 from conans.errors import ConanInvalidConfiguration
 from io import StringIO
+import hashlib
 import os
 import re
 import textwrap
@@ -21,7 +22,10 @@ class CPythonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "optimizations": [True, False],
+        "pgo_task": "ANY",  # python arguments of the PGO training run, "upstream" to use upstream's default
+        "pgo_profile": "ANY",  # recorded clang profile (code.profclangd), used instead of a training run
         "lto": [True, False],
+        "computed_gotos": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
         "with_bz2": [True, False],
@@ -36,6 +40,7 @@ class CPythonConan(ConanFile):
         "with_bsddb": [True, False],
         # Python 3 options
         "with_lzma": [True, False],
+        "stdlib_zip": [True, False],  # precompiled standard library in a single zip, for faster startup
 
         # options that don't change package id
         "env_vars": [True, False],  # set environment variables
@@ -44,7 +49,10 @@ class CPythonConan(ConanFile):
         "shared": False,
         "fPIC": True,
         "optimizations": False,
+        "pgo_task": None,
+        "pgo_profile": None,
         "lto": False,
+        "computed_gotos": True,
         "docstrings": True,
         "pymalloc": True,
         "with_bz2": True,
@@ -59,6 +67,7 @@ class CPythonConan(ConanFile):
         "with_bsddb": False,  # True,  # FIXME: libdb package missing (#5309/#5392)
         # Python 3 options
         "with_lzma": True,
+        "stdlib_zip": False,
 
         # options that don't change package id
         "env_vars": True,
@@ -103,6 +112,8 @@ class CPythonConan(ConanFile):
             del self.options.fPIC
         if self.settings.compiler == "Visual Studio":
             del self.options.lto
+            del self.options.pgo_profile
+            del self.options.computed_gotos
             del self.options.docstrings
             del self.options.pymalloc
             del self.options.with_curses
@@ -111,6 +122,7 @@ class CPythonConan(ConanFile):
         if self._is_py2:
             # Python 2.xx does not support following options
             del self.options.with_lzma
+            del self.options.stdlib_zip
         elif self._is_py3:
             # Python 3.xx does not support following options
             del self.options.with_bsddb
@@ -122,6 +134,8 @@ class CPythonConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.optimizations:
+            del self.options.pgo_task
         if not self._supports_modules:
                 del self.options.with_bz2
                 del self.options.with_sqlite3
@@ -137,14 +151,24 @@ class CPythonConan(ConanFile):
         if self.options.shared:
             if self.settings.compiler == "Visual Studio" and "MT" in self.settings.compiler.runtime:
                 raise ConanInvalidConfiguration("cpython does not support MT(d) runtime when building a shared cpython library")
+        if self.options.optimizations:
+            if tools.cross_building(self, skip_x64_x86=True):
+                raise ConanInvalidConfiguration("optimizations=True needs to run the built interpreter, use the pgo_profile option to cross build with a recorded profile")
+            if self.options.get_safe("pgo_profile"):
+                raise ConanInvalidConfiguration("optimizations=True records a new profile, it can't be combined with pgo_profile")
+        if self.options.get_safe("pgo_profile"):
+            if self.settings.compiler not in ("clang", "apple-clang"):
+                raise ConanInvalidConfiguration("pgo_profile is only supported with clang (llvm profile data)")
+            if not os.path.isfile(str(self.options.pgo_profile)):
+                raise ConanInvalidConfiguration("pgo_profile must be the path of an existing profile data file")
+        if self.options.get_safe("stdlib_zip"):
+            if tools.cross_building(self, skip_x64_x86=True):
+                raise ConanInvalidConfiguration("stdlib_zip=True needs to run the built interpreter, it can't be used when cross building")
+            if self.settings.compiler == "Visual Studio" and not self.options.shared:
+                raise ConanInvalidConfiguration("stdlib_zip=True requires a shared cpython with Visual Studio")
         if self.settings.compiler == "Visual Studio":
-            if self.options.optimizations:
-                raise ConanInvalidConfiguration("This recipe does not support optimized MSVC cpython builds (yet)")
-                # FIXME: should probably throw when cross building
-                # FIXME: optimizations for Visual Studio, before building the final `build_type`:
-                # 1. build the MSVC PGInstrument build_type,
-                # 2. run the instrumented binaries, (PGInstrument should have created a `python.bat` file in the PCbuild folder)
-                # 3. build the MSVC PGUpdate build_type
+            if self.options.optimizations and self.settings.build_type == "Debug":
+                raise ConanInvalidConfiguration("optimizations=True requires a release build_type with Visual Studio")
             if self.settings.build_type == "Debug" and "d" not in self.settings.compiler.runtime:
                 raise ConanInvalidConfiguration("Building debug cpython requires a debug runtime (Debug cpython requires _CrtReportMode symbol, which only debug runtimes define)")
             if self._is_py2:
@@ -161,6 +185,14 @@ class CPythonConan(ConanFile):
 
     def package_id(self):
         del self.info.options.env_vars
+        pgo_profile = self.options.get_safe("pgo_profile")
+        if pgo_profile:
+            # The profile contents matter, not where it is stored on the host
+            if os.path.isfile(str(pgo_profile)):
+                with open(str(pgo_profile), "rb") as f:
+                    self.info.options.pgo_profile = hashlib.sha256(f.read()).hexdigest()
+            else:
+                self.info.options.pgo_profile = "custom"
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version],
@@ -221,6 +253,7 @@ class CPythonConan(ConanFile):
             "--with-system-ffi",
             "--enable-optimizations={}".format(yes_no(self.options.optimizations)),
             "--with-lto={}".format(yes_no(self.options.lto)),
+            "--with-computed-gotos={}".format(yes_no(self.options.computed_gotos)),
             "--with-pydebug={}".format(yes_no(self.settings.build_type == "Debug")),
         ]
         if self._is_py2:
@@ -254,6 +287,10 @@ class CPythonConan(ConanFile):
         if self.settings.os in ("Linux", "FreeBSD"):
             # Building _testembed fails due to missing pthread/rt symbols
             self._autotools.link_flags.append("-lpthread")
+        if self.options.pgo_profile:
+            profile_use_flag = "-fprofile-instr-use={}".format(self.options.pgo_profile)
+            self._autotools.flags.append(profile_use_flag)
+            self._autotools.link_flags.append(profile_use_flag)
 
         build = None
         if tools.cross_building(self) and not tools.cross_building(self, skip_x64_x86=True):
@@ -390,20 +427,50 @@ class CPythonConan(ConanFile):
             })
         return archs
 
+    @property
+    def _pgo_task(self):
+        """Python arguments of the PGO training run, None to keep upstream's default"""
+        task = str(self.options.pgo_task) if self.options.pgo_task else None
+        if task == "upstream":
+            return None
+        if task:
+            return task
+        # A reduced set of hermetic tests: no network, no subprocess timing, same order in every run
+        tests = ("test_array", "test_bisect", "test_bytes", "test_collections", "test_datetime",
+                 "test_decimal", "test_difflib", "test_functools", "test_hashlib", "test_heapq",
+                 "test_itertools", "test_json", "test_math", "test_operator", "test_pickle",
+                 "test_re", "test_set", "test_string", "test_struct", "test_unicode")
+        regrtest = "test.regrtest" if self._is_py2 else "test"
+        return "-m {} --pgo -j1 {}".format(regrtest, " ".join(tests))
+
     def _msvc_build(self):
+        if self.options.optimizations:
+            # 1. build instrumented binaries, 2. run the training task, 3. rebuild using the recorded profile
+            self._msvc_build_projects("PGInstrument")
+            instrumented_path = os.path.join(self._msvc_artifacts_path, "instrumented")
+            self._copy_essential_dlls(instrumented_path)
+            task = self._pgo_task or "-m test --pgo"
+            self.run("{} {}".format(os.path.join(instrumented_path, self._cpython_interpreter_name), task),
+                     run_environment=True, ignore_errors=True)
+            self._msvc_build_projects("PGUpdate", upgrade=False)
+        else:
+            self._msvc_build_projects("Debug" if self.settings.build_type == "Debug" else "Release")
+
+    def _msvc_build_projects(self, configuration, upgrade=True):
         msbuild = MSBuild(self)
         msbuild_properties = {
             "IncludeExternals": "true",
         }
         projects = self._solution_projects
-        self.output.info("Building {} Visual Studio projects: {}".format(len(projects), projects))
+        self.output.info("Building {} Visual Studio projects ({}): {}".format(len(projects), configuration, projects))
 
         with tools.no_op():
             for project_i, project in enumerate(projects, 1):
                 self.output.info("[{}/{}] Building project '{}'...".format(project_i, len(projects), project))
                 project_file = os.path.join(self._source_subfolder, "PCbuild", project + ".vcxproj")
-                self._upgrade_single_project_file(project_file)
-                msbuild.build(project_file, upgrade_project=False, build_type="Debug" if self.settings.build_type == "Debug" else "Release",
+                if upgrade:
+                    self._upgrade_single_project_file(project_file)
+                msbuild.build(project_file, upgrade_project=False, build_type=configuration,
                               platforms=self._msvc_archs, properties=msbuild_properties)
 
     def build(self):
@@ -425,7 +492,10 @@ class CPythonConan(ConanFile):
             self._msvc_build()
         else:
             autotools = self._configure_autotools()
-            autotools.make()
+            make_args = []
+            if self.options.optimizations and self._pgo_task:
+                make_args.append("PROFILE_TASK={}".format(self._pgo_task))
+            autotools.make(args=make_args)
 
     @property
     def _msvc_artifacts_path(self):
@@ -445,11 +515,11 @@ class CPythonConan(ConanFile):
     def _msvc_install_subprefix(self):
         return "bin"
 
-    def _copy_essential_dlls(self):
+    def _copy_essential_dlls(self, artifacts_path=None):
         if self.settings.compiler == "Visual Studio":
             # Until MSVC builds support cross building, copy dll's of essential (shared) dependencies to python binary location.
-            # These dll's are required when running the layout tool using the newly built python executable.
-            dest_path = os.path.join(self.build_folder, self._msvc_artifacts_path)
+            # These dll's are required when running the layout tool (or the PGO training) using the newly built python executable.
+            dest_path = os.path.join(self.build_folder, artifacts_path or self._msvc_artifacts_path)
             if self._with_libffi:
                 for bin_path in self.deps_cpp_info["libffi"].bin_paths:
                     self.copy("*.dll", src=bin_path, dst=dest_path)
@@ -479,6 +549,8 @@ class CPythonConan(ConanFile):
         ]
         if self.options.with_tkinter:
             layout_args.append("--include-tcltk")
+        if self.options.stdlib_zip:
+            layout_args.extend(["--precompile", "--zip-lib"])
         if self.settings.build_type == "Debug":
             layout_args.append("-d")
         python_args = " ".join("\"{}\"".format(a) for a in layout_args)
@@ -566,8 +638,58 @@ class CPythonConan(ConanFile):
 
             if not os.path.exists(self._cpython_symlink):
                 os.symlink("python{}".format(self._version_suffix), self._cpython_symlink)
+
+            if self.options.get_safe("stdlib_zip"):
+                self._zip_stdlib()
+
+            # Keep the recorded clang profile, so it can be reused by cross builds (pgo_profile option)
+            if self.options.optimizations:
+                self.copy("code.profclangd", dst=self._pgo_profile_subfolder, keep_path=False)
         self._fix_install_name()
 
+    @property
+    def _stdlib_zip_path(self):
+        # This archive is part of the default sys.path of the interpreter (PYTHONPATH is not needed)
+        if self.settings.compiler == "Visual Studio":
+            return os.path.join(self.package_folder, self._msvc_install_subprefix, "python{}.zip".format(self._version_suffix))
+        return os.path.join(self.package_folder, "lib", "python{}.zip".format("".join(self._version_tuple[:2])))
+
+    def _zip_stdlib(self):
+        # Packages that read data files next to their modules, or must stay on disk, are not zipped.
+        # os.py is kept as well: it is the landmark used by the interpreter to find its prefix.
+        script = textwrap.dedent("""\
+            import os, shutil, sys, zipfile
+            stdlib, archive = sys.argv[1], sys.argv[2]
+            keep = {"site-packages", "lib-dynload", "ensurepip", "idlelib", "lib2to3", "test", "tkinter", "turtledemo", "venv"}
+            zipped = []
+            # zipimport loads the .pyc files whatever their optimization level: strip asserts (-O)
+            with zipfile.PyZipFile(archive, "w", zipfile.ZIP_STORED, optimize=1) as zf:
+                for entry in sorted(os.listdir(stdlib)):
+                    path = os.path.join(stdlib, entry)
+                    if entry in keep or entry.startswith("config-") or entry == "__pycache__":
+                        continue
+                    if os.path.isfile(os.path.join(path, "__init__.py")) or (os.path.isfile(path) and entry.endswith(".py")):
+                        zf.writepy(path)
+                        zipped.append(path)
+            for path in zipped:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.basename(path) != "os.py":
+                    os.remove(path)
+            shutil.rmtree(os.path.join(stdlib, "__pycache__"), ignore_errors=True)
+        """)
+        script_path = os.path.join(self.build_folder, "zip_stdlib.py")
+        tools.save(script_path, script)
+        version = tools.Version(self._version_number_only)
+        stdlib = os.path.join(self.package_folder, "lib", "python{}.{}".format(version.major, version.minor))
+        libdir = os.path.join(self.package_folder, "lib")
+        with tools.environment_append({"LD_LIBRARY_PATH": libdir, "DYLD_LIBRARY_PATH": libdir}):
+            self.run("\"{}\" \"{}\" \"{}\" \"{}\"".format(self._cpython_interpreter_path, script_path, stdlib, self._stdlib_zip_path))
+
+    @property
+    def _pgo_profile_subfolder(self):
+        return os.path.join("res", "pgo")
+
     @property
     def _cpython_symlink(self):
         symlink = os.path.join(self.package_folder, "bin", "python")
@@ -736,3 +858,10 @@ class CPythonConan(ConanFile):
                 self.output.info("Setting PYTHON_ROOT environment variable: {}".format(python_root))
                 self.env_info.PYTHON_ROOT = python_root
         self.user_info.python_root = python_root
+
+        if self.options.get_safe("stdlib_zip"):
+            self.user_info.stdlib_zip = self._stdlib_zip_path
+
+        pgo_profile = os.path.join(self.package_folder, self._pgo_profile_subfolder, "code.profclangd")
+        if os.path.isfile(pgo_profile):
+            self.user_info.pgo_profile = pgo_profile
@@ -1,12 +1,14 @@
 from conan import ConanFile
+from conan.errors import ConanException
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.env import VirtualBuildEnv
-from conan.tools.files import copy, get, replace_in_file, rm, rmdir
+from conan.tools.files import copy, get, load, replace_in_file, rm, rmdir
 from conan.tools.layout import basic_layout
 from conan.tools.meson import Meson, MesonToolchain
 from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
+import re
 
 required_conan_version = ">=1.50.0"
 
@@ -43,7 +45,8 @@ class Dav1dConan(ConanFile):
         if is_msvc(self) and self.settings.build_type == "Debug":
             # debug builds with assembly often causes linker hangs or LNK1000
             self.options.assembly = False
-        if Version(self.version) < "1.0.0":
+        if Version(self.version) >= "1.0.0":
+            # AVX-512 kernels are always built since 1.0.0 when the assembler supports them
             del self.options.with_avx512
 
     def configure(self):
@@ -58,7 +61,10 @@ class Dav1dConan(ConanFile):
         except Exception:
             pass
         if not self.options.assembly:
-            del self.options.with_avx512
+            try:
+                del self.options.with_avx512
+            except Exception:
+                pass
 
     def build_requirements(self):
         self.tool_requires("meson/0.63.1")
@@ -95,10 +101,28 @@ class Dav1dConan(ConanFile):
         replace_in_file(self, os.path.join(self.source_folder, "meson.build"),
                               "subdir('doc')", "")
 
+    @property
+    def _expects_avx512(self):
+        if not self.options.assembly or self.settings.arch != "x86_64":
+            return False
+        return self.options.get_safe("with_avx512", True)
+
+    def _check_avx512(self):
+        # meson only warns and drops the AVX-512 kernels when nasm is too old
+        config_asm = os.path.join(self.build_folder, "config.asm")
+        if not os.path.isfile(config_asm):
+            return
+        match = re.search(r"%define HAVE_AVX512ICL (\d)", load(self, config_asm))
+        if match and match.group(1) != "1":
+            raise ConanException("dav1d was configured without AVX-512 support, "
+                                 "a more recent nasm is required (>= 2.14)")
+
     def build(self):
         self._patch_sources()
         meson = Meson(self)
         meson.configure()
+        if self._expects_avx512:
+            self._check_avx512()
         meson.build()
 
     def package(self):
@@ -1,6 +1,7 @@
 from conan import ConanFile
 from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.scm import Version
 import os
 
 
@@ -21,5 +22,15 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if not cross_building(self):
+            clip = os.path.join(self.source_folder, "test_clip.ivf")
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
-            self.run(bin_path, env="conanrun")
+            self.run("{} {}".format(bin_path, clip), env="conanrun")
+
+            dav1d = self.dependencies["dav1d"]
+            if dav1d.options.with_tools:
+                if Version(dav1d.ref.version) >= "1.0.0":
+                    threading = "--threads 4 --framedelay 2"
+                else:
+                    threading = "--framethreads 2 --tilethreads 2"
+                # fps is reported on stderr at the end of decoding
+                self.run("dav1d -i {} -o {} --muxer null {}".format(clip, os.devnull, threading), env="conanrun")
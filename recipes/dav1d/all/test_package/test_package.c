@@ -1,9 +1,144 @@
 #include "dav1d/dav1d.h"
 
+#include <errno.h>
+#include <stdint.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
 
-int main()
+#define IVF_HEADER_SIZE 32
+#define IVF_FRAME_HEADER_SIZE 12
+#define DECODE_LOOPS 50
+
+static uint32_t read_le32(const uint8_t *p)
+{
+    return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) | ((uint32_t)p[3] << 24);
+}
+
+static double now(void)
+{
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+}
+
+static int decode_ivf(Dav1dContext *c, const uint8_t *ivf, size_t size, unsigned *frames)
+{
+    size_t offset = IVF_HEADER_SIZE;
+    Dav1dPicture picture;
+    int res;
+
+    while (offset + IVF_FRAME_HEADER_SIZE <= size) {
+        const size_t frame_size = read_le32(ivf + offset);
+        Dav1dData data;
+        uint8_t *buffer;
+
+        offset += IVF_FRAME_HEADER_SIZE;
+        if (offset + frame_size > size) {
+            fprintf(stderr, "truncated IVF frame\n");
+            return -1;
+        }
+        memset(&data, 0, sizeof(data));
+        buffer = dav1d_data_create(&data, frame_size);
+        if (buffer == NULL) {
+            return -1;
+        }
+        memcpy(buffer, ivf + offset, frame_size);
+        offset += frame_size;
+
+        do {
+            res = dav1d_send_data(c, &data);
+            if (res < 0 && res != DAV1D_ERR(EAGAIN)) {
+                dav1d_data_unref(&data);
+                return res;
+            }
+            memset(&picture, 0, sizeof(picture));
+            res = dav1d_get_picture(c, &picture);
+            if (res == 0) {
+                ++*frames;
+                dav1d_picture_unref(&picture);
+            } else if (res != DAV1D_ERR(EAGAIN)) {
+                dav1d_data_unref(&data);
+                return res;
+            }
+        } while (data.sz > 0);
+    }
+
+    /* drain the frames still in flight in the frame threads */
+    for (;;) {
+        memset(&picture, 0, sizeof(picture));
+        res = dav1d_get_picture(c, &picture);
+        if (res == DAV1D_ERR(EAGAIN)) {
+            return 0;
+        }
+        if (res < 0) {
+            return res;
+        }
+        ++*frames;
+        dav1d_picture_unref(&picture);
+    }
+}
+
+int main(int argc, char **argv)
 {
+    Dav1dSettings settings;
+    Dav1dContext *c = NULL;
+    uint8_t *ivf;
+    long size;
+    unsigned frames = 0;
+    double start, elapsed;
+    FILE *f;
+    int i;
+
     printf("dav1d version: %s\n", dav1d_version());
+    if (argc < 2) {
+        return 0;
+    }
+
+    f = fopen(argv[1], "rb");
+    if (f == NULL) {
+        fprintf(stderr, "unable to open %s\n", argv[1]);
+        return 1;
+    }
+    fseek(f, 0, SEEK_END);
+    size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    ivf = malloc((size_t)size);
+    if (ivf == NULL || fread(ivf, 1, (size_t)size, f) != (size_t)size || size < IVF_HEADER_SIZE || memcmp(ivf, "DKIF", 4) != 0) {
+        fprintf(stderr, "%s is not an IVF file\n", argv[1]);
+        fclose(f);
+        free(ivf);
+        return 1;
+    }
+    fclose(f);
+
+    dav1d_default_settings(&settings);
+    if (dav1d_open(&c, &settings) < 0) {
+        fprintf(stderr, "dav1d_open failed\n");
+        free(ivf);
+        return 1;
+    }
+
+    start = now();
+    for (i = 0; i < DECODE_LOOPS; ++i) {
+        if (decode_ivf(c, ivf, (size_t)size, &frames) < 0) {
+            fprintf(stderr, "decoding failed\n");
+            dav1d_close(&c);
+            free(ivf);
+            return 1;
+        }
+        dav1d_flush(c);
+    }
+    elapsed = now() - start;
+
+    dav1d_close(&c);
+    free(ivf);
+
+    if (frames == 0) {
+        fprintf(stderr, "no frame decoded\n");
+        return 1;
+    }
+    printf("decoded %u frames in %.3f s (%.1f fps)\n", frames, elapsed, elapsed > 0 ? frames / elapsed : 0.);
     return 0;
 }
@@ -14,5 +14,13 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if not tools.cross_building(self):
+            clip = os.path.join(self.source_folder, os.pardir, "test_package", "test_clip.ivf")
             bin_path = os.path.join("bin", "test_package")
-            self.run(bin_path, run_environment=True)
+            self.run("{} {}".format(bin_path, clip), run_environment=True)
+
+            if self.options["dav1d"].with_tools:
+                if tools.Version(self.deps_cpp_info["dav1d"].version) >= "1.0.0":
+                    threading = "--threads 4 --framedelay 2"
+                else:
+                    threading = "--framethreads 2 --tilethreads 2"
+                self.run("dav1d -i {} -o {} --muxer null {}".format(clip, os.devnull, threading), run_environment=True)
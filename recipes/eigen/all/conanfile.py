@@ -1,6 +1,7 @@
 import os
 
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, cmake_layout, CMakeToolchain
 from conan.tools.files import apply_conandata_patches, copy, get, rmdir
 
@@ -18,18 +19,51 @@ class EigenConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "MPL2_only": [True, False],
+        "with_blas": [True, False],
+        "with_lapacke": [True, False],
+        "with_openmp": [True, False],
+        "dont_parallelize": [True, False],
+        "vectorize": [True, False],
+        "max_align_bytes": ["auto", "0", "16", "32", "64"],
     }
     default_options = {
         "MPL2_only": False,
+        "with_blas": False,
+        "with_lapacke": False,
+        "with_openmp": False,
+        "dont_parallelize": False,
+        "vectorize": True,
+        "max_align_bytes": "auto",
     }
     license = ("MPL-2.0", "LGPL-3.0-or-later")  # Taking into account the default value of MPL2_only option
 
     def configure(self):
         self.license = "MPL-2.0" if self.options.MPL2_only else ("MPL-2.0", "LGPL-3.0-or-later")
 
+    @property
+    def _openmp_flags(self):
+        if self.settings.compiler in ("Visual Studio", "msvc"):
+            return ["-openmp"]
+        elif self.settings.compiler == "gcc":
+            return ["-fopenmp"]
+        # clang and apple-clang flags are provided by llvm-openmp
+        return []
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self.options.with_blas or self.options.with_lapacke:
+            self.requires("openblas/0.3.20")
+        if self.options.with_openmp and self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/12.0.1")
+
+    def validate(self):
+        if self.options.with_openmp and self.options.dont_parallelize:
+            raise ConanInvalidConfiguration(f"{self.ref} with_openmp and dont_parallelize are mutually exclusive")
+        if self.options.with_lapacke and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref} with_lapacke requires openblas:build_lapack=True")
+
     def export_sources(self):
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
             copy(self, patch["patch_file"], self.recipe_folder, self.export_sources_folder)
@@ -65,8 +99,29 @@ class EigenConan(ConanFile):
         # TODO: back to global scope once cmake_find_package* generators removed
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["eigen3"].system_libs = ["m"]
+        # These defines must be identical in every translation unit (ODR and alignment issues otherwise),
+        # so they are propagated to consumers instead of being left to each project
         if self.options.MPL2_only:
-            self.cpp_info.components["eigen3"].defines = ["EIGEN_MPL2_ONLY"]
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_MPL2_ONLY")
+        if self.options.with_blas:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_BLAS")
+        if self.options.with_lapacke:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_LAPACKE")
+        if self.options.with_blas or self.options.with_lapacke:
+            self.cpp_info.components["eigen3"].requires.append("openblas::openblas")
+        if self.options.with_openmp:
+            self.cpp_info.components["eigen3"].cxxflags.extend(self._openmp_flags)
+            self.cpp_info.components["eigen3"].sharedlinkflags.extend(self._openmp_flags)
+            self.cpp_info.components["eigen3"].exelinkflags.extend(self._openmp_flags)
+            if self.settings.compiler in ("clang", "apple-clang"):
+                self.cpp_info.components["eigen3"].requires.append("llvm-openmp::llvm-openmp")
+        if self.options.dont_parallelize:
+            # Eigen would otherwise parallelize as soon as a translation unit is built with OpenMP
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_DONT_PARALLELIZE")
+        if not self.options.vectorize:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_DONT_VECTORIZE")
+        if self.options.max_align_bytes != "auto":
+            self.cpp_info.components["eigen3"].defines.append(f"EIGEN_MAX_ALIGN_BYTES={self.options.max_align_bytes}")
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
         self.cpp_info.names["cmake_find_package"] = "Eigen3"
@@ -7,7 +7,7 @@ import glob
 import shutil
 import re
 
-required_conan_version = ">=1.36.0"
+required_conan_version = ">=1.38.0"
 
 
 class FFMpegConan(ConanFile):
@@ -32,6 +32,9 @@ class FFMpegConan(ConanFile):
         "postproc": [True, False],
         "avfilter": [True, False],
         "with_asm": [True, False],
+        "with_runtime_cpudetect": [True, False],
+        "with_pthreads": [True, False],
+        "enable_lto": [True, False],
         "with_zlib": [True, False],
         "with_bzip2": [True, False],
         "with_lzma": [True, False],
@@ -46,6 +49,9 @@ class FFMpegConan(ConanFile):
         "with_libx264": [True, False],
         "with_libx265": [True, False],
         "with_libvpx": [True, False],
+        "with_dav1d": [True, False],
+        "with_libaom": [True, False],
+        "with_libsvtav1": [True, False],
         "with_libmp3lame": [True, False],
         "with_libfdk_aac": [True, False],
         "with_libwebp": [True, False],
@@ -109,6 +115,9 @@ class FFMpegConan(ConanFile):
         "postproc": True,
         "avfilter": True,
         "with_asm": True,
+        "with_runtime_cpudetect": True,
+        "with_pthreads": True,
+        "enable_lto": False,
         "with_zlib": True,
         "with_bzip2": True,
         "with_lzma": True,
@@ -123,6 +132,9 @@ class FFMpegConan(ConanFile):
         "with_libx264": True,
         "with_libx265": True,
         "with_libvpx": True,
+        "with_dav1d": False,
+        "with_libaom": False,
+        "with_libsvtav1": False,
         "with_libmp3lame": True,
         "with_libfdk_aac": True,
         "with_libwebp": True,
@@ -191,6 +203,15 @@ class FFMpegConan(ConanFile):
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
+    @property
+    def _with_nasm(self):
+        return self.options.with_asm and self.settings.arch in ("x86", "x86_64")
+
+    @property
+    def _nasm_min_version(self):
+        # older assemblers silently lose the AVX2/AVX-512 code paths, or fail the configure checks
+        return "2.13"
+
     @property
     def _dependencies(self):
         return {
@@ -209,6 +230,9 @@ class FFMpegConan(ConanFile):
             "with_libx264": ["avcodec"],
             "with_libx265": ["avcodec"],
             "with_libvpx": ["avcodec"],
+            "with_dav1d": ["avcodec"],
+            "with_libaom": ["avcodec"],
+            "with_libsvtav1": ["avcodec"],
             "with_libmp3lame": ["avcodec"],
             "with_libfdk_aac": ["avcodec"],
             "with_libwebp": ["avcodec"],
@@ -223,6 +247,8 @@ class FFMpegConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # w32threads are used instead
+            del self.options.with_pthreads
         if not self.settings.os in ["Linux", "FreeBSD"]:
             del self.options.with_vaapi
             del self.options.with_vdpau
@@ -240,6 +266,8 @@ class FFMpegConan(ConanFile):
             del self.options.with_avfoundation
         if not self._version_supports_vulkan():
             del self.options.with_vulkan
+        if not self._version_supports_libsvtav1():
+            del self.options.with_libsvtav1
 
     def configure(self):
         if self.options.shared:
@@ -276,6 +304,13 @@ class FFMpegConan(ConanFile):
             self.requires("libx265/3.4")
         if self.options.with_libvpx:
             self.requires("libvpx/1.11.0")
+        if self.options.with_dav1d:
+            # dav1d 1.0 removed the frame_threads/tile_threads settings used by older libavcodec
+            self.requires("dav1d/1.0.0" if tools.Version(self.version) >= "5.0" else "dav1d/0.9.1")
+        if self.options.with_libaom:
+            self.requires("libaom-av1/3.4.0")
+        if self.options.get_safe("with_libsvtav1"):
+            self.requires("svt-av1/1.2.1")
         if self.options.with_libmp3lame:
             self.requires("libmp3lame/3.100")
         if self.options.with_libfdk_aac:
@@ -302,6 +337,12 @@ class FFMpegConan(ConanFile):
             raise ConanInvalidConfiguration(
                 "securetransport is only available on Apple")
 
+        if self.options.get_safe("with_libsvtav1") and not self.options["svt-av1"].build_encoder:
+            raise ConanInvalidConfiguration("FFmpeg 'with_libsvtav1' option requires 'svt-av1:build_encoder=True'")
+
+        if self.options.with_libaom and not (self.options["libaom-av1"].encoder and self.options["libaom-av1"].decoder):
+            raise ConanInvalidConfiguration("FFmpeg 'with_libaom' option requires 'libaom-av1:encoder=True' and 'libaom-av1:decoder=True'")
+
         for dependency, features in self._dependencies.items():
             if not self.options.get_safe(dependency):
                 continue
@@ -313,8 +354,8 @@ class FFMpegConan(ConanFile):
                     dependency, "' or '".join(features)))
 
     def build_requirements(self):
-        if self.settings.arch in ("x86", "x86_64"):
-            self.build_requires("yasm/1.3.0")
+        if self._with_nasm:
+            self.build_requires("nasm/2.15.05")
         self.build_requires("pkgconf/1.7.4")
         if self._settings_build.os == "Windows" and not tools.get_env("CONAN_BASH_PATH"):
             self.build_requires("msys2/cci.latest")
@@ -391,6 +432,7 @@ class FFMpegConan(ConanFile):
             "--disable-doc",
             opt_enable_disable("cross-compile", tools.cross_building(self)),
             opt_enable_disable("asm", self.options.with_asm),
+            opt_enable_disable("runtime-cpudetect", self.options.with_runtime_cpudetect),
             # Libraries
             opt_enable_disable("shared", self.options.shared),
             opt_enable_disable("static", not self.options.shared),
@@ -418,6 +460,8 @@ class FFMpegConan(ConanFile):
             opt_enable_disable("libx264", self.options.with_libx264),
             opt_enable_disable("libx265", self.options.with_libx265),
             opt_enable_disable("libvpx", self.options.with_libvpx),
+            opt_enable_disable("libdav1d", self.options.with_dav1d),
+            opt_enable_disable("libaom", self.options.with_libaom),
             opt_enable_disable("libmp3lame", self.options.with_libmp3lame),
             opt_enable_disable("libfdk-aac", self.options.with_libfdk_aac),
             opt_enable_disable("libwebp", self.options.with_libwebp),
@@ -517,14 +561,27 @@ class FFMpegConan(ConanFile):
         if self._version_supports_vulkan():
             args.append(opt_enable_disable(
                 "vulkan", self.options.get_safe("with_vulkan")))
+        if self._version_supports_libsvtav1():
+            args.append(opt_enable_disable(
+                "libsvtav1", self.options.get_safe("with_libsvtav1")))
         if tools.is_apple_os(self.settings.os):
             # relocatable shared libs
             args.append("--install-name-dir=@rpath")
         args.append("--arch={}".format(self._target_arch))
+        if self._with_nasm:
+            args.append("--x86asmexe=nasm")
+        if self.options.get_safe("with_pthreads") is not None:
+            args.append(opt_enable_disable("pthreads", self.options.with_pthreads))
+        if self.options.enable_lto:
+            args.append("--enable-lto")
         if self.settings.build_type == "Debug":
+            if not self.options.with_asm:
+                # inline asm can't be compiled at -O0, and disabling mmx disables all the x86 SIMD code
+                args.extend([
+                    "--disable-optimizations",
+                    "--disable-mmx",
+                ])
             args.extend([
-                "--disable-optimizations",
-                "--disable-mmx",
                 "--disable-stripping",
                 "--enable-debug",
             ])
@@ -584,7 +641,16 @@ class FFMpegConan(ConanFile):
         options_string = str(options_list)
         return [_format_options_list_item(flag_name, item) for item in _split_options_string(options_string)]
 
+    def _check_nasm_version(self):
+        # fail early rather than in the middle of configure/make
+        nasm_version = self.dependencies.build["nasm"].ref.version
+        if tools.Version(nasm_version) < self._nasm_min_version:
+            raise ConanInvalidConfiguration("FFmpeg with_asm=True requires nasm >= {}, found {}".format(
+                self._nasm_min_version, nasm_version))
+
     def build(self):
+        if self._with_nasm:
+            self._check_nasm_version()
         self._patch_sources()
         tools.replace_in_file(os.path.join(self._source_subfolder, "configure"),
                               "echo libx264.lib", "echo x264.lib")
@@ -843,6 +909,15 @@ class FFMpegConan(ConanFile):
             if self.options.with_libvpx:
                 self.cpp_info.components["avcodec"].requires.append(
                     "libvpx::libvpx")
+            if self.options.with_dav1d:
+                self.cpp_info.components["avcodec"].requires.append(
+                    "dav1d::dav1d")
+            if self.options.with_libaom:
+                self.cpp_info.components["avcodec"].requires.append(
+                    "libaom-av1::libaom-av1")
+            if self.options.get_safe("with_libsvtav1"):
+                self.cpp_info.components["avcodec"].requires.append(
+                    "svt-av1::encoder")
             if self.options.with_libmp3lame:
                 self.cpp_info.components["avcodec"].requires.append(
                     "libmp3lame::libmp3lame")
@@ -902,3 +977,7 @@ class FFMpegConan(ConanFile):
 
     def _version_supports_vulkan(self):
         return tools.Version(self.version) >= "4.3.0"
+
+    def _version_supports_libsvtav1(self):
+        # libsvtav1 wrapper added in 4.4, but it only builds against SVT-AV1 >= 0.9 API since 5.0
+        return tools.Version(self.version) >= "5.0"
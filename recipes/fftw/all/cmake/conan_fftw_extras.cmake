@@ -0,0 +1,76 @@
+# Injected with CMAKE_PROJECT_INCLUDE, provides features of fftw autotools build
+# which are missing in its CMake build:
+#  - AVX-512, AVX-128-FMA and NEON codelets (--enable-avx512, --enable-avx-128-fma, --enable-neon)
+#  - generation of a wisdom file (fftw-wisdom)
+# fftw library targets are only known at the end of fftw CMakeLists, hence the deferred call.
+
+function(conan_fftw_extras)
+    foreach(_suffix "" f l q)
+        if(TARGET fftw3${_suffix})
+            set(_fftw_lib fftw3${_suffix})
+            set(_prec_suffix "${_suffix}")
+        endif()
+    endforeach()
+    if(NOT _fftw_lib)
+        message(FATAL_ERROR "fftw library target not found")
+    endif()
+
+    if(CONAN_FFTW_SIMD)
+        if(CONAN_FFTW_SIMD STREQUAL "avx512")
+            set(_simd_dir avx512)
+            set(_simd_define HAVE_AVX512)
+            if(MSVC)
+                set(_simd_flags /arch:AVX512)
+            else()
+                set(_simd_flags -mavx512f)
+            endif()
+        elseif(CONAN_FFTW_SIMD STREQUAL "avx_128_fma")
+            set(_simd_dir avx-128-fma)
+            set(_simd_define HAVE_AVX_128_FMA)
+            set(_simd_flags -mavx -mfma4)
+        elseif(CONAN_FFTW_SIMD STREQUAL "neon")
+            set(_simd_dir neon)
+            set(_simd_define HAVE_NEON)
+            set(_simd_flags "")
+        else()
+            message(FATAL_ERROR "Unsupported SIMD extension: ${CONAN_FFTW_SIMD}")
+        endif()
+
+        file(GLOB _simd_sources
+            "${PROJECT_SOURCE_DIR}/dft/simd/${_simd_dir}/*.c"
+            "${PROJECT_SOURCE_DIR}/rdft/simd/${_simd_dir}/*.c"
+        )
+        if(NOT _simd_sources)
+            message(FATAL_ERROR "No ${_simd_dir} codelets found in fftw sources")
+        endif()
+        if(_simd_flags)
+            set_source_files_properties(${_simd_sources} PROPERTIES COMPILE_OPTIONS "${_simd_flags}")
+        endif()
+        target_sources(${_fftw_lib} PRIVATE ${_simd_sources})
+        # also enables the runtime detection in simd-support and the registration of codelets in planner
+        target_compile_definitions(${_fftw_lib} PRIVATE ${_simd_define}=1)
+        message(STATUS "fftw${_prec_suffix}: ${_simd_dir} codelets enabled")
+    endif()
+
+    if(CONAN_FFTW_WISDOM)
+        set(_generator conan_fftw${_prec_suffix}_wisdom)
+        set(_wisdom_file "${CMAKE_CURRENT_BINARY_DIR}/wisdom${_prec_suffix}")
+        add_executable(${_generator} "${CONAN_FFTW_WISDOM_SOURCE}")
+        target_include_directories(${_generator} PRIVATE "${PROJECT_SOURCE_DIR}/api")
+        if(_prec_suffix STREQUAL "f")
+            target_compile_definitions(${_generator} PRIVATE ENABLE_SINGLE_PRECISION=1)
+        elseif(_prec_suffix STREQUAL "l")
+            target_compile_definitions(${_generator} PRIVATE ENABLE_LONG_DOUBLE_PRECISION=1)
+        endif()
+        target_link_libraries(${_generator} PRIVATE ${_fftw_lib})
+        add_custom_command(
+            OUTPUT "${_wisdom_file}"
+            COMMAND ${_generator} "${_wisdom_file}" ${CONAN_FFTW_WISDOM_SIZES}
+            DEPENDS ${_generator}
+            COMMENT "Generating fftw${_prec_suffix} wisdom"
+        )
+        add_custom_target(${_generator}_file ALL DEPENDS "${_wisdom_file}")
+    endif()
+endfunction()
+
+cmake_language(DEFER DIRECTORY "${CMAKE_SOURCE_DIR}" CALL conan_fftw_extras)
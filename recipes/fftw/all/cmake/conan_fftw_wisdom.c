@@ -0,0 +1,77 @@
+/*
+ * Plans complex (in-place and out-of-place, both directions) and real 1D
+ * transforms of the given sizes with FFTW_MEASURE, then exports accumulated
+ * wisdom to a file, in the same format as fftw-wisdom.
+ *
+ * usage: conan_fftw_wisdom <wisdom file> [size...]
+ */
+#include "fftw3.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+
+#if defined(ENABLE_SINGLE_PRECISION)
+typedef float real_t;
+#define FFTW_MANGLE(name) FFTW_MANGLE_FLOAT(name)
+#elif defined(ENABLE_LONG_DOUBLE_PRECISION)
+typedef long double real_t;
+#define FFTW_MANGLE(name) FFTW_MANGLE_LONG_DOUBLE(name)
+#else
+typedef double real_t;
+#define FFTW_MANGLE(name) FFTW_MANGLE_DOUBLE(name)
+#endif
+
+static int learn(FFTW_MANGLE(plan) plan)
+{
+    if (plan == NULL) {
+        return 0;
+    }
+    FFTW_MANGLE(destroy_plan)(plan);
+    return 1;
+}
+
+int main(int argc, char **argv)
+{
+    int i;
+
+    if (argc < 2) {
+        fprintf(stderr, "usage: %s <wisdom file> [size...]\n", argv[0]);
+        return 1;
+    }
+
+    for (i = 2; i < argc; ++i) {
+        int n = atoi(argv[i]);
+        real_t *real;
+        FFTW_MANGLE(complex) *in, *out;
+        int ok;
+
+        if (n <= 0) {
+            fprintf(stderr, "invalid size: %s\n", argv[i]);
+            return 1;
+        }
+        real = FFTW_MANGLE(alloc_real)(n);
+        in = FFTW_MANGLE(alloc_complex)(n);
+        out = FFTW_MANGLE(alloc_complex)(n);
+        ok = real != NULL && in != NULL && out != NULL
+            && learn(FFTW_MANGLE(plan_dft_1d)(n, in, out, FFTW_FORWARD, FFTW_MEASURE))
+            && learn(FFTW_MANGLE(plan_dft_1d)(n, in, out, FFTW_BACKWARD, FFTW_MEASURE))
+            && learn(FFTW_MANGLE(plan_dft_1d)(n, in, in, FFTW_FORWARD, FFTW_MEASURE))
+            && learn(FFTW_MANGLE(plan_dft_1d)(n, in, in, FFTW_BACKWARD, FFTW_MEASURE))
+            && learn(FFTW_MANGLE(plan_dft_r2c_1d)(n, real, out, FFTW_MEASURE))
+            && learn(FFTW_MANGLE(plan_dft_c2r_1d)(n, out, real, FFTW_MEASURE));
+        FFTW_MANGLE(free)(out);
+        FFTW_MANGLE(free)(in);
+        FFTW_MANGLE(free)(real);
+        if (!ok) {
+            fprintf(stderr, "failed to plan transforms of size %d\n", n);
+            return 1;
+        }
+        printf("planned size %d\n", n);
+    }
+
+    if (!FFTW_MANGLE(export_wisdom_to_filename)(argv[1])) {
+        fprintf(stderr, "failed to write %s\n", argv[1]);
+        return 1;
+    }
+    return 0;
+}
@@ -1,7 +1,8 @@
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import cross_building
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, get, rmdir
+from conan.tools.files import apply_conandata_patches, copy, get
 import os
 
 required_conan_version = ">=1.47.0"
@@ -19,31 +20,64 @@ class FFTWConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
-        "precision": ["double", "single", "longdouble"],
+        "precision": ["double", "single", "longdouble", "deprecated"],
+        "precision_double": [True, False],
+        "precision_single": [True, False],
+        "precision_longdouble": [True, False],
         "openmp": [True, False],
         "threads": [True, False],
         "combinedthreads": [True, False],
-        "simd": ["sse", "sse2", "avx", "avx2", False],
+        "simd": ["sse", "sse2", "avx", "avx2", "avx512", "avx_128_fma", "neon", False],
+        "with_wisdom": [True, False],
+        "wisdom_sizes": ["ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
-        "precision": "double",
+        "precision": "deprecated",
+        "precision_double": True,
+        "precision_single": False,
+        "precision_longdouble": False,
         "openmp": False,
         "threads": False,
         "combinedthreads": False,
         "simd": False,
+        "with_wisdom": False,
+        "wisdom_sizes": "64,256,1024,4096,16384,65536",
     }
 
+    @property
+    def _prec_suffix(self):
+        return {
+            "double": "",
+            "single": "f",
+            "longdouble": "l"
+        }
+
+    @property
+    def _precisions(self):
+        return [p for p in ("double", "single", "longdouble") if self.options.get_safe("precision_" + p)]
+
+    @property
+    def _extra_simd(self):
+        # SIMD extensions not handled by fftw CMakeLists, see cmake/conan_fftw_extras.cmake
+        return self.options.simd in ["avx512", "avx_128_fma", "neon"]
+
     def export_sources(self):
         for p in self.conan_data.get("patches", {}).get(self.version, []):
             copy(self, p["patch_file"], self.recipe_folder, self.export_sources_folder)
+        copy(self, "cmake/*", self.recipe_folder, self.export_sources_folder)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
 
     def configure(self):
+        if self.options.precision != "deprecated":
+            self.output.warn("precision option is deprecated, use 'precision_double', 'precision_single' and 'precision_longdouble' instead")
+            self.options.precision_double = self.options.precision == "double"
+            self.options.precision_single = self.options.precision == "single"
+            self.options.precision_longdouble = self.options.precision == "longdouble"
         if self.options.shared:
             del self.options.fPIC
         try:
@@ -56,14 +90,46 @@ class FFTWConan(ConanFile):
             pass
         if not self.options.threads:
             del self.options.combinedthreads
+        if not self.options.with_wisdom:
+            del self.options.wisdom_sizes
+
+    def package_id(self):
+        del self.info.options.precision
 
     def validate(self):
+        if not self._precisions:
+            raise ConanInvalidConfiguration("At least one of precision_double, precision_single or precision_longdouble must be enabled")
+        if self.options.simd:
+            if self.options.simd in ["sse", "sse2", "avx", "avx2", "avx512", "avx_128_fma"] and \
+               self.settings.arch not in ["x86", "x86_64"]:
+                raise ConanInvalidConfiguration(f"simd={self.options.simd} requires an x86 architecture")
+            if self.options.simd == "neon" and self.settings.arch not in ["armv8", "armv8.3"]:
+                # on 32-bit ARM, fftw NEON codelets only support single precision
+                raise ConanInvalidConfiguration("simd=neon requires armv8")
+            if self.options.simd == "avx_128_fma" and self.settings.compiler in ["Visual Studio", "msvc"]:
+                raise ConanInvalidConfiguration("simd=avx_128_fma (FMA4) is not supported by Visual Studio")
+            if not [p for p in self._precisions if self._simd_enabled(p)]:
+                raise ConanInvalidConfiguration(f"simd={self.options.simd} is not supported by any of the enabled precisions")
+        if self.options.with_wisdom:
+            if cross_building(self):
+                raise ConanInvalidConfiguration("with_wisdom can't be used when cross-building, wisdom must be generated on the target")
+            try:
+                sizes = [int(n) for n in str(self.options.wisdom_sizes).split(",")]
+            except ValueError:
+                sizes = []
+            if not sizes or min(sizes) <= 0:
+                raise ConanInvalidConfiguration("wisdom_sizes must be a comma separated list of positive transform sizes")
         if self.settings.os == "Windows" and self.options.shared:
             if self.options.openmp:
                 raise ConanInvalidConfiguration("Shared fftw with openmp can't be built on Windows")
             if self.options.threads and not self.options.combinedthreads:
                 raise ConanInvalidConfiguration("Shared fftw with threads and not combinedthreads can't be built on Windows")
 
+    def build_requirements(self):
+        if self._extra_simd or self.options.with_wisdom:
+            # cmake_language(DEFER) is required by cmake/conan_fftw_extras.cmake
+            self.tool_requires("cmake/3.24.0")
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -77,66 +143,105 @@ class FFTWConan(ConanFile):
         tc.variables["ENABLE_OPENMP"] = self.options.openmp
         tc.variables["ENABLE_THREADS"] = self.options.threads
         tc.variables["WITH_COMBINED_THREADS"] = self.options.get_safe("combinedthreads", False)
-        tc.variables["ENABLE_FLOAT"] = self.options.precision == "single"
-        tc.variables["ENABLE_LONG_DOUBLE"] = self.options.precision == "longdouble"
-        tc.variables["ENABLE_SSE"] = self.options.simd == "sse"
-        tc.variables["ENABLE_SSE2"] = self.options.simd == "sse2"
-        tc.variables["ENABLE_AVX"] = self.options.simd == "avx"
-        tc.variables["ENABLE_AVX2"] = self.options.simd == "avx2"
+        if self._extra_simd or self.options.with_wisdom:
+            extras_dir = os.path.join(self.source_folder, os.pardir, "cmake").replace("\\", "/")
+            tc.cache_variables["CMAKE_PROJECT_INCLUDE"] = f"{extras_dir}/conan_fftw_extras.cmake"
+            tc.variables["CONAN_FFTW_WISDOM"] = self.options.with_wisdom
+            if self.options.with_wisdom:
+                tc.variables["CONAN_FFTW_WISDOM_SOURCE"] = f"{extras_dir}/conan_fftw_wisdom.c"
+                tc.variables["CONAN_FFTW_WISDOM_SIZES"] = str(self.options.wisdom_sizes).replace(",", ";")
         # Honor BUILD_SHARED_LIBS from conan_toolchain (see https://github.com/conan-io/conan/issues/11840)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
         tc.generate()
 
+    def _simd_enabled(self, precision):
+        if not self.options.simd or precision == "longdouble":
+            return False
+        # sse codelets are single precision only
+        return self.options.simd != "sse" or precision == "single"
+
+    def _cmake_variables(self, precision):
+        simd = str(self.options.simd) if self._simd_enabled(precision) else None
+        variables = {
+            "ENABLE_FLOAT": precision == "single",
+            "ENABLE_LONG_DOUBLE": precision == "longdouble",
+            "ENABLE_SSE": simd == "sse",
+            "ENABLE_SSE2": simd == "sse2",
+            # avx2 codelets are kept along avx512 ones, as a fallback on CPUs without AVX-512
+            "ENABLE_AVX": simd == "avx",
+            "ENABLE_AVX2": simd in ["avx2", "avx512"],
+        }
+        if self._extra_simd:
+            variables["CONAN_FFTW_SIMD"] = simd or ""
+        return variables
+
     def build(self):
         apply_conandata_patches(self)
+        # fftw builds one precision at a time: reconfigure the same build tree for each of them,
+        # library names are suffixed by precision so that they don't overwrite each other
         cmake = CMake(self)
-        cmake.configure()
-        cmake.build()
+        for precision in self._precisions:
+            cmake.configure(variables=self._cmake_variables(precision))
+            cmake.build()
 
     def package(self):
         copy(self, "COPYRIGHT", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
-        cmake = CMake(self)
-        cmake.install()
-        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
-        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        # not cmake.install(): it would only install the last configured precision
+        for pattern in ["fftw3.h", "fftw3.f", "fftw3l.f03", "fftw3q.f03"]:
+            copy(self, pattern, src=os.path.join(self.source_folder, "api"), dst=os.path.join(self.package_folder, "include"))
+        copy(self, "fftw3.f03", src=self.build_folder, dst=os.path.join(self.package_folder, "include"), keep_path=False)
+        for precision in self._precisions:
+            lib_name = "fftw3" + self._prec_suffix[precision]
+            for lib_pattern in [f"*{lib_name}.lib", f"*{lib_name}.a", f"*{lib_name}.so*", f"*{lib_name}.*dylib",
+                                f"*{lib_name}_*.lib", f"*{lib_name}_*.a", f"*{lib_name}_*.so*", f"*{lib_name}_*.*dylib"]:
+                copy(self, lib_pattern, src=self.build_folder, dst=os.path.join(self.package_folder, "lib"), keep_path=False)
+            for dll_pattern in [f"*{lib_name}.dll", f"*{lib_name}_*.dll"]:
+                copy(self, dll_pattern, src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
+            if self.options.with_wisdom:
+                copy(self, "wisdom" + self._prec_suffix[precision], src=self.build_folder,
+                     dst=os.path.join(self.package_folder, "res", "fftw"), keep_path=False)
 
     def package_info(self):
-        prec_suffix = self._prec_suffix[str(self.options.precision)]
-        cmake_config_name = "FFTW3" + prec_suffix
+        precisions = self._precisions
         cmake_namespace = "FFTW3"
-        cmake_target_name = "fftw3" + prec_suffix
-        pkgconfig_name = "fftw3" + prec_suffix
-        lib_name = "fftw3" + prec_suffix
+        # keep legacy config file name when only one precision is packaged
+        cmake_config_name = "FFTW3" + self._prec_suffix[precisions[0]] if len(precisions) == 1 else "FFTW3"
 
         self.cpp_info.set_property("cmake_file_name", cmake_config_name)
-        self.cpp_info.set_property("cmake_target_name", "{}::{}".format(cmake_namespace, cmake_target_name))
-        self.cpp_info.set_property("pkg_config_name", pkgconfig_name)
-
-        # TODO: back to global scope in conan v2 once cmake_find_package_* & pkg_config generators removed
-        if self.options.openmp:
-            self.cpp_info.components["fftwlib"].libs.append(lib_name + "_omp")
-        if self.options.threads and not self.options.combinedthreads:
-            self.cpp_info.components["fftwlib"].libs.append(lib_name + "_threads")
-        self.cpp_info.components["fftwlib"].libs.append(lib_name)
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["fftwlib"].system_libs.append("m")
-            if self.options.threads:
-                self.cpp_info.components["fftwlib"].system_libs.append("pthread")
+        if len(precisions) == 1:
+            lib_name = "fftw3" + self._prec_suffix[precisions[0]]
+            self.cpp_info.set_property("cmake_target_name", "{}::{}".format(cmake_namespace, lib_name))
+            self.cpp_info.set_property("pkg_config_name", lib_name)
 
         # TODO: to remove in conan v2 once cmake_find_package_* & pkg_config generators removed
         self.cpp_info.filenames["cmake_find_package"] = cmake_config_name
         self.cpp_info.filenames["cmake_find_package_multi"] = cmake_config_name
         self.cpp_info.names["cmake_find_package"] = cmake_namespace
         self.cpp_info.names["cmake_find_package_multi"] = cmake_namespace
-        self.cpp_info.components["fftwlib"].names["cmake_find_package"] = cmake_target_name
-        self.cpp_info.components["fftwlib"].names["cmake_find_package_multi"] = cmake_target_name
-        self.cpp_info.components["fftwlib"].set_property("cmake_target_name", "{}::{}".format(cmake_namespace, cmake_target_name))
-        self.cpp_info.components["fftwlib"].set_property("pkg_config_name", pkgconfig_name)
 
-    @property
-    def _prec_suffix(self):
-        return {
-            "double": "",
-            "single": "f",
-            "longdouble": "l"
-        }
+        for precision in precisions:
+            lib_name = "fftw3" + self._prec_suffix[precision]
+            component = self.cpp_info.components[lib_name]
+            if self.options.openmp:
+                component.libs.append(lib_name + "_omp")
+            if self.options.threads and not self.options.combinedthreads:
+                component.libs.append(lib_name + "_threads")
+            component.libs.append(lib_name)
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                component.system_libs.append("m")
+                if self.options.threads:
+                    component.system_libs.append("pthread")
+            component.set_property("cmake_target_name", "{}::{}".format(cmake_namespace, lib_name))
+            component.set_property("pkg_config_name", lib_name)
+
+            # TODO: to remove in conan v2 once cmake_find_package_* & pkg_config generators removed
+            component.names["cmake_find_package"] = lib_name
+            component.names["cmake_find_package_multi"] = lib_name
+
+            if self.options.with_wisdom:
+                # wisdom is specific to the CPU it was generated on, import it with fftw*_import_wisdom_from_filename()
+                wisdom_var = "FFTW3{}_WISDOM".format(self._prec_suffix[precision].upper())
+                wisdom_file = os.path.join(self.package_folder, "res", "fftw", "wisdom" + self._prec_suffix[precision])
+                self.runenv_info.define_path(wisdom_var, wisdom_file)
+                # TODO: to remove in conan v2
+                setattr(self.env_info, wisdom_var, wisdom_file)
@@ -16,9 +16,10 @@ class TestPackageConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["ENABLE_DOUBLE_PRECISION"] = self.dependencies["fftw"].options.precision == "double"
-        tc.variables["ENABLE_SINGLE_PRECISION"] = self.dependencies["fftw"].options.precision == "single"
-        tc.variables["ENABLE_LONG_DOUBLE_PRECISION"] = self.dependencies["fftw"].options.precision == "longdouble"
+        fftw_options = self.dependencies["fftw"].options
+        tc.variables["ENABLE_DOUBLE_PRECISION"] = fftw_options.precision_double
+        tc.variables["ENABLE_SINGLE_PRECISION"] = fftw_options.precision_single
+        tc.variables["ENABLE_LONG_DOUBLE_PRECISION"] = fftw_options.precision_longdouble
         tc.generate()
 
     def build(self):
@@ -28,5 +29,10 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if not cross_building(self):
-            bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
-            self.run(bin_path, env="conanrun")
+            fftw_options = self.dependencies["fftw"].options
+            for lib_name, enabled in [("fftw3", fftw_options.precision_double),
+                                      ("fftw3f", fftw_options.precision_single),
+                                      ("fftw3l", fftw_options.precision_longdouble)]:
+                if enabled:
+                    bin_path = os.path.join(self.cpp.build.bindirs[0], f"test_package_{lib_name}")
+                    self.run(bin_path, env="conanrun")
@@ -1,23 +1,40 @@
 #include "fftw3.h"
 
+#include <stdio.h>
+#include <stdlib.h>
+
 // switch API to match the precision option (fftw_|fftwf_|fftwl)
 #if defined(ENABLE_SINGLE_PRECISION)
 typedef float real_t;
 #define FFTW_MANGLE(name) FFTW_MANGLE_FLOAT(name)
+#define WISDOM_VAR "FFTW3F_WISDOM"
 #elif defined(ENABLE_LONG_DOUBLE_PRECISION)
 typedef long double real_t;
 #define FFTW_MANGLE(name) FFTW_MANGLE_LONG_DOUBLE(name)
+#define WISDOM_VAR "FFTW3L_WISDOM"
 #else
 typedef double real_t;
 #define FFTW_MANGLE(name) FFTW_MANGLE_DOUBLE(name)
+#define WISDOM_VAR "FFTW3_WISDOM"
 #endif
 
 int main() {
     long size = 256;
+    const char* wisdom = getenv(WISDOM_VAR);
     real_t* input = FFTW_MANGLE(alloc_real)(size);
     FFTW_MANGLE(complex)* output = FFTW_MANGLE(alloc_complex)(size);
-    FFTW_MANGLE(plan) plan = (FFTW_MANGLE(plan_dft_r2c_1d)(
-          size, input, output, FFTW_ESTIMATE));
+    FFTW_MANGLE(plan) plan = NULL;
+    if (wisdom) {
+        if (!FFTW_MANGLE(import_wisdom_from_filename)(wisdom)) {
+            printf("failed to import wisdom from %s\n", wisdom);
+            return 1;
+        }
+        plan = FFTW_MANGLE(plan_dft_r2c_1d)(size, input, output, FFTW_MEASURE | FFTW_WISDOM_ONLY);
+        printf("wisdom imported from %s, size %ld %s\n", wisdom, size, plan ? "found" : "not found");
+    }
+    if (!plan) {
+        plan = FFTW_MANGLE(plan_dft_r2c_1d)(size, input, output, FFTW_ESTIMATE);
+    }
     FFTW_MANGLE(execute)(plan);
     FFTW_MANGLE(destroy_plan)(plan);
     FFTW_MANGLE(free)(output);
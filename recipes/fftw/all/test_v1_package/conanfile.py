@@ -9,13 +9,17 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
-        cmake.definitions["ENABLE_DOUBLE_PRECISION"] = self.options["fftw"].precision == "double"
-        cmake.definitions["ENABLE_SINGLE_PRECISION"] = self.options["fftw"].precision == "single"
-        cmake.definitions["ENABLE_LONG_DOUBLE_PRECISION"] = self.options["fftw"].precision == "longdouble"
+        cmake.definitions["ENABLE_DOUBLE_PRECISION"] = self.options["fftw"].precision_double
+        cmake.definitions["ENABLE_SINGLE_PRECISION"] = self.options["fftw"].precision_single
+        cmake.definitions["ENABLE_LONG_DOUBLE_PRECISION"] = self.options["fftw"].precision_longdouble
         cmake.configure()
         cmake.build()
 
     def test(self):
         if not tools.cross_building(self):
-            bin_path = os.path.join("bin", "test_package")
-            self.run(bin_path, run_environment=True)
+            for lib_name, enabled in [("fftw3", self.options["fftw"].precision_double),
+                                      ("fftw3f", self.options["fftw"].precision_single),
+                                      ("fftw3l", self.options["fftw"].precision_longdouble)]:
+                if enabled:
+                    bin_path = os.path.join("bin", f"test_package_{lib_name}")
+                    self.run(bin_path, run_environment=True)
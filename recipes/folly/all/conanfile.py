@@ -22,10 +22,14 @@ class FollyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_jemalloc": False,
+        "with_liburing": False,
     }
 
     generators = "cmake", "cmake_find_package"
@@ -60,6 +64,8 @@ class FollyConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux" or Version(self.version) < "2020.08.10.00":
+            del self.options.with_liburing
 
     def configure(self):
         if self.options.shared:
@@ -81,7 +87,10 @@ class FollyConan(ConanFile):
             self.requires("libdwarf/20191104")
         self.requires("libsodium/1.0.18")
         self.requires("xz_utils/5.2.5")
-        # FIXME: Causing compilation issues on clang: self.requires("jemalloc/5.2.1")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/5.2.1")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.2")
         if self.settings.os == "Linux":
             self.requires("libiberty/9.1.0")
             self.requires("libunwind/1.5.0")
@@ -118,6 +127,9 @@ class FollyConan(ConanFile):
         if self.version == "2020.08.10.00" and self.settings.compiler == "clang" and self.options.shared:
             raise ConanInvalidConfiguration("Folly could not be built by clang as a shared library")
 
+        if self.options.with_jemalloc and self.settings.compiler in ["clang", "apple-clang"]:
+            raise ConanInvalidConfiguration("Folly with_jemalloc=True can not be built by {} (jemalloc headers fail to compile)".format(self.settings.compiler))
+
         if self.options["boost"].header_only:
             raise ConanInvalidConfiguration("Folly could not be built with a header only Boost")
 
@@ -153,6 +165,10 @@ class FollyConan(ConanFile):
             cmake.definitions["HAVE_VSNPRINTF_ERRORS_EXITCODE"] = "0"
             cmake.definitions["HAVE_VSNPRINTF_ERRORS_EXITCODE__TRYRUN_OUTPUT"] = ""
         cmake.definitions["CMAKE_POSITION_INDEPENDENT_CODE"] = self.options.get_safe("fPIC", True)
+        # IoUring backends of folly::io::async are only built if liburing is found
+        cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibUring"] = not self.options.get_safe("with_liburing")
+        # No libaio recipe: don't let AsyncIO pick it up from the system
+        cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibAIO"] = True
 
         cxx_std_flag = tools.cppstd_flag(self.settings)
         cxx_std_value = cxx_std_flag.split('=')[1] if cxx_std_flag else "c++{}".format(self._minimum_cpp_standard)
@@ -185,7 +201,6 @@ class FollyConan(ConanFile):
         # TODO: back to global scope in conan v2 once cmake_find_package_* generators removed
         if Version(self.version) == "2019.10.21.00":
             self.cpp_info.components["libfolly"].libs = [
-                "follybenchmark",
                 "folly_test_util",
                 "folly"
             ]
@@ -196,13 +211,11 @@ class FollyConan(ConanFile):
                     "folly_exception_tracer",
                     "folly_exception_tracer_base",
                     "folly_test_util",
-                    "follybenchmark",
                     "folly"
                 ]
             else:
                 self.cpp_info.components["libfolly"].libs = [
                     "folly_test_util",
-                    "follybenchmark",
                     "folly"
                 ]
 
@@ -226,6 +239,11 @@ class FollyConan(ConanFile):
         if self.settings.os == "Linux":
             self.cpp_info.components["libfolly"].requires.extend(["libiberty::libiberty", "libunwind::libunwind"])
             self.cpp_info.components["libfolly"].system_libs.extend(["pthread", "dl", "rt"])
+        if self.options.with_jemalloc:
+            self.cpp_info.components["libfolly"].requires.append("jemalloc::jemalloc")
+        if self.options.get_safe("with_liburing"):
+            # IoUring and IoUringBackend are part of libfolly
+            self.cpp_info.components["libfolly"].requires.append("liburing::liburing")
 
         if Version(self.version) >= "2020.08.10.00":
             self.cpp_info.components["libfolly"].requires.append("fmt::fmt")
@@ -244,6 +262,12 @@ class FollyConan(ConanFile):
         if self.settings.os == "Macos" and self.settings.compiler == "apple-clang" and Version(self.settings.compiler.version.value) >= "11.0":
             self.cpp_info.components["libfolly"].system_libs.append("c++abi")
 
+        # folly::Benchmark
+        self.cpp_info.components["follybenchmark"].libs = ["follybenchmark"]
+        self.cpp_info.components["follybenchmark"].requires = ["libfolly"]
+        self.cpp_info.components["follybenchmark"].set_property("cmake_target_name", "Folly::follybenchmark")
+        self.cpp_info.components["follybenchmark"].set_property("pkg_config_name", "libfollybenchmark")
+
         # TODO: to remove in conan v2 once cmake_find_package_* & pkg_config generators removed
         self.cpp_info.filenames["cmake_find_package"] = "folly"
         self.cpp_info.filenames["cmake_find_package_multi"] = "folly"
@@ -254,3 +278,5 @@ class FollyConan(ConanFile):
         self.cpp_info.components["libfolly"].names["cmake_find_package_multi"] = "folly"
         self.cpp_info.components["libfolly"].set_property("cmake_target_name", "Folly::folly")
         self.cpp_info.components["libfolly"].set_property("pkg_config_name", "libfolly")
+        self.cpp_info.components["follybenchmark"].names["cmake_find_package"] = "follybenchmark"
+        self.cpp_info.components["follybenchmark"].names["cmake_find_package_multi"] = "follybenchmark"
@@ -6,6 +6,7 @@
 #include <folly/executors/ThreadedExecutor.h>
 #include <folly/Uri.h>
 #include <folly/FBString.h>
+#include <folly/memory/Malloc.h>
 #if FOLLY_HAVE_ELF
 #include <folly/experimental/symbolizer/Elf.h>
 #endif
@@ -22,6 +23,7 @@ int main() {
     folly::Future<folly::Unit> unit = std::move(future).thenValue(print_uri);
     promise.setValue("https://github.com/bincrafters");
     std::move(unit).get();
+    std::cout << "jemalloc in use: " << std::boolalpha << folly::usingJEMalloc() << std::endl;
 #if FOLLY_HAVE_ELF
     folly::symbolizer::ElfFile elffile;
 #endif
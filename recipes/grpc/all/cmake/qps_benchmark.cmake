@@ -0,0 +1,129 @@
+# Builds qps_worker and qps_json_driver (grpc's QPS benchmark) against the
+# libraries of this build, without enabling gRPC_BUILD_TESTS (which requires
+# googletest and all the testing protos to be vendored).
+
+set(_qps_source_dir "${CMAKE_CURRENT_SOURCE_DIR}/source_subfolder")
+set(_qps_gens_dir "${CMAKE_CURRENT_BINARY_DIR}/qps_gens")
+file(MAKE_DIRECTORY "${_qps_gens_dir}")
+
+find_program(_qps_protoc NAMES protoc PATHS ${CONAN_BIN_DIRS_PROTOBUF} NO_DEFAULT_PATH)
+if(NOT _qps_protoc)
+    message(FATAL_ERROR "protoc not found, required to build the QPS benchmark")
+endif()
+
+# well known types (google/protobuf/*.proto) are shipped in protobuf include directory
+set(_qps_protoc_includes -I ${_qps_source_dir})
+foreach(_dir ${CONAN_INCLUDE_DIRS_PROTOBUF})
+    list(APPEND _qps_protoc_includes -I ${_dir})
+endforeach()
+
+set(_qps_protos
+    src/proto/grpc/core/stats.proto
+    src/proto/grpc/testing/benchmark_service.proto
+    src/proto/grpc/testing/control.proto
+    src/proto/grpc/testing/messages.proto
+    src/proto/grpc/testing/payloads.proto
+    src/proto/grpc/testing/report_qps_scenario_service.proto
+    src/proto/grpc/testing/stats.proto
+    src/proto/grpc/testing/worker_service.proto
+)
+
+set(_qps_proto_srcs)
+foreach(_proto ${_qps_protos})
+    string(REGEX REPLACE "\\.proto$" "" _proto_we "${_proto}")
+    set(_outputs
+        "${_qps_gens_dir}/${_proto_we}.pb.cc"
+        "${_qps_gens_dir}/${_proto_we}.pb.h"
+        "${_qps_gens_dir}/${_proto_we}.grpc.pb.cc"
+        "${_qps_gens_dir}/${_proto_we}.grpc.pb.h"
+        "${_qps_gens_dir}/${_proto_we}_mock.grpc.pb.h"
+    )
+    add_custom_command(
+        OUTPUT ${_outputs}
+        COMMAND ${_qps_protoc}
+        ARGS --grpc_out=generate_mock_code=true:${_qps_gens_dir}
+             --cpp_out=${_qps_gens_dir}
+             --plugin=protoc-gen-grpc=$<TARGET_FILE:grpc_cpp_plugin>
+             ${_qps_protoc_includes}
+             ${_proto}
+        DEPENDS "${_qps_source_dir}/${_proto}" grpc_cpp_plugin
+        WORKING_DIRECTORY ${_qps_source_dir}
+        COMMENT "Running gRPC C++ protocol buffer compiler for ${_proto}"
+    )
+    list(APPEND _qps_proto_srcs ${_outputs})
+endforeach()
+
+# Test utilities used by the QPS sources (a subset of grpc_test_util, grpc++_test_util and grpc++_test_config).
+# The list covers all supported versions, files which don't exist in a given version are skipped.
+set(_qps_util_candidates
+    test/core/end2end/data/client_certs.cc
+    test/core/end2end/data/server1_cert.cc
+    test/core/end2end/data/server1_key.cc
+    test/core/end2end/data/test_root_cert.cc
+    test/core/event_engine/test_init.cc
+    test/core/util/build.cc
+    test/core/util/cmdline.cc
+    test/core/util/histogram.cc
+    test/core/util/port.cc
+    test/core/util/port_isolated.cc
+    test/core/util/port_server_client.cc
+    test/core/util/resolve_localhost_ip46.cc
+    test/core/util/stack_tracer.cc
+    test/core/util/test_config.cc
+    test/core/util/tls_utils.cc
+    test/cpp/util/byte_buffer_proto_helper.cc
+    test/cpp/util/create_test_channel.cc
+    test/cpp/util/string_ref_helper.cc
+    test/cpp/util/test_config_cc.cc
+    test/cpp/util/test_credentials_provider.cc
+)
+set(_qps_util_srcs)
+foreach(_src ${_qps_util_candidates})
+    if(EXISTS "${_qps_source_dir}/${_src}")
+        list(APPEND _qps_util_srcs "${_qps_source_dir}/${_src}")
+    endif()
+endforeach()
+
+set(_qps_srcs)
+foreach(_src
+        benchmark_config.cc
+        client_async.cc
+        client_callback.cc
+        client_sync.cc
+        driver.cc
+        parse_json.cc
+        qps_server_builder.cc
+        qps_worker.cc
+        report.cc
+        server_async.cc
+        server_callback.cc
+        server_sync.cc
+        usage_timer.cc)
+    list(APPEND _qps_srcs "${_qps_source_dir}/test/cpp/qps/${_src}")
+endforeach()
+
+add_library(grpc_qps_support STATIC ${_qps_proto_srcs} ${_qps_util_srcs} ${_qps_srcs})
+target_include_directories(grpc_qps_support PUBLIC
+    "${_qps_gens_dir}"
+    "${_qps_source_dir}"
+    "${_qps_source_dir}/include"
+    "${_qps_source_dir}/src/core/ext/upb-generated"
+    "${_qps_source_dir}/src/core/ext/upbdefs-generated"
+    "${_qps_source_dir}/third_party/upb"
+    "${_qps_source_dir}/third_party/xxhash"
+)
+target_link_libraries(grpc_qps_support PUBLIC grpc++ grpc gpr upb ${CONAN_LIBS_ABSEIL} ${CONAN_LIBS_PROTOBUF})
+
+foreach(_qps_executable qps_worker qps_json_driver)
+    if(_qps_executable STREQUAL "qps_worker")
+        set(_main "${_qps_source_dir}/test/cpp/qps/worker.cc")
+    else()
+        set(_main "${_qps_source_dir}/test/cpp/qps/qps_json_driver.cc")
+    endif()
+    add_executable(${_qps_executable} ${_main})
+    target_link_libraries(${_qps_executable} PRIVATE grpc_qps_support)
+    install(TARGETS ${_qps_executable}
+        RUNTIME DESTINATION bin
+        BUNDLE DESTINATION bin
+    )
+endforeach()
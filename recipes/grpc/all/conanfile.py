@@ -30,7 +30,10 @@ class grpcConan(ConanFile):
         "php_plugin": [True, False],
         "python_plugin": [True, False],
         "ruby_plugin": [True, False],
-        "secure": [True, False]
+        "secure": [True, False],
+        "poll_strategy": ["all", "epoll1", "poll"],
+        "plugins_only": [True, False],
+        "qps_benchmark": [True, False],
     }
     default_options = {
         "shared": False,
@@ -45,6 +48,9 @@ class grpcConan(ConanFile):
         "python_plugin": True,
         "ruby_plugin": True,
         "secure": False,
+        "poll_strategy": "all",
+        "plugins_only": False,
+        "qps_benchmark": False,
     }
 
     short_paths = True
@@ -71,15 +77,21 @@ class grpcConan(ConanFile):
     def _cxxstd_required(self):
         return 14 if Version(self.version) >= "1.47" else 11
 
+    @property
+    def _qps_benchmark_module(self):
+        return "qps_benchmark.cmake"
+
     def export_sources(self):
         self.copy("CMakeLists.txt")
         self.copy(os.path.join("cmake", self._grpc_plugin_template))
+        self.copy(os.path.join("cmake", self._qps_benchmark_module))
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
             self.copy(patch["patch_file"])
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            del self.options.poll_strategy
 
     def configure(self):
         if self.options.shared:
@@ -116,11 +128,31 @@ class grpcConan(ConanFile):
         if self.settings.compiler.get_safe("cppstd"):
             tools_legacy.check_min_cppstd(self, self._cxxstd_required)
 
+        if self.options.get_safe("poll_strategy") == "epoll1" and self.settings.os not in ["Linux", "Android"]:
+            raise ConanInvalidConfiguration("poll_strategy=epoll1 is only available on Linux and Android")
+
+        if self.options.plugins_only and not any(self.options.get_safe(plugin_option) for plugin_option in self._grpc_plugins.keys()):
+            raise ConanInvalidConfiguration("plugins_only=True requires at least one of the *_plugin options")
+
+        if self.options.qps_benchmark:
+            if self.options.plugins_only:
+                raise ConanInvalidConfiguration("qps_benchmark=True can't be combined with plugins_only=True")
+            if not self.options.codegen or not self.options.cpp_plugin:
+                raise ConanInvalidConfiguration("qps_benchmark=True requires codegen=True and cpp_plugin=True")
+            if tools.build.cross_building(self):
+                raise ConanInvalidConfiguration("qps_benchmark=True is not supported when cross building")
+
         if self.options.shared and (not self.options["protobuf"].shared or not self.options["googleapis"].shared or not self.options["grpc-proto"].shared):
             raise ConanInvalidConfiguration("If built as shared, protobuf, googleapis and grpc-proto must be shared as well. Please, use `protobuf:shared=True` and `googleapis:shared=True` and `grpc-proto:shared=True`")
 
     def package_id(self):
         del self.info.options.secure
+        if self.options.plugins_only:
+            # only the codegen plugins are packaged, they don't depend on these options
+            del self.info.options.codegen
+            del self.info.options.csharp_ext
+            if self.options.get_safe("poll_strategy"):
+                del self.info.options.poll_strategy
         self.info.requires["protobuf"].full_package_mode()
 
     def build_requirements(self):
@@ -146,9 +178,11 @@ class grpcConan(ConanFile):
         # cmake.definitions["CONAN_ENABLE_MOBILE"] = "ON" if self.options.csharp_ext else "OFF"
 
         self._cmake = CMake(self)
-        self._cmake.definitions["gRPC_BUILD_CODEGEN"] = self.options.codegen
+        self._cmake.definitions["gRPC_BUILD_CODEGEN"] = self.options.codegen or self.options.plugins_only
         self._cmake.definitions["gRPC_BUILD_CSHARP_EXT"] = self.options.csharp_ext
         self._cmake.definitions["gRPC_BUILD_TESTS"] = False
+        # qps_worker and qps_json_driver are built by the wrapper, not by gRPC_BUILD_TESTS
+        self._cmake.definitions["GRPC_BUILD_QPS_BENCHMARK"] = self.options.qps_benchmark
 
         # We need the generated cmake/ files (bc they depend on the list of targets, which is dynamic)
         self._cmake.definitions["gRPC_INSTALL"] = True
@@ -194,7 +228,16 @@ class grpcConan(ConanFile):
             tools_legacy.patch(**patch)
 
         # Clean existing proto files, they will be taken from requirements
-        shutil.rmtree(os.path.join(self._source_subfolder, "src", "proto", "grpc"))
+        # (except those of the QPS benchmark, which are not part of grpc-proto with the same import paths)
+        protos_folder = os.path.join(self._source_subfolder, "src", "proto", "grpc")
+        for proto_subfolder in os.listdir(protos_folder):
+            if self.options.qps_benchmark and proto_subfolder in ["core", "testing"]:
+                continue
+            path = os.path.join(protos_folder, proto_subfolder)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
 
         if Version(self.version) >= "1.47":
             # Take googleapis from requirement instead of vendored/hardcoded version
@@ -210,18 +253,43 @@ class grpcConan(ConanFile):
             "set(_gRPC_PROTOBUF_PROTOC_EXECUTABLE $<TARGET_FILE:protobuf::protoc>)"
         )
 
+        poll_strategy = self.options.get_safe("poll_strategy")
+        if poll_strategy and poll_strategy != "all":
+            # Default of GRPC_POLL_STRATEGY, the environment variable still takes precedence at runtime
+            tools_legacy.replace_in_file(os.path.join(self._source_subfolder, "src", "core", "lib", "iomgr", "ev_posix.cc"),
+                "grpc_poll_strategy, \"all\"",
+                "grpc_poll_strategy, \"{}\"".format(poll_strategy)
+            )
+
     def build(self):
         self._patch_sources()
         cmake = self._configure_cmake()
-        cmake.build()
+        if self.options.plugins_only:
+            # The plugins only depend on grpc_plugin_support and libprotoc, skip the runtime libraries
+            for plugin_option, values in self._grpc_plugins.items():
+                if self.options.get_safe(plugin_option):
+                    cmake.build(target=values["executable"])
+        else:
+            cmake.build()
 
     def package(self):
         self.copy(pattern="LICENSE", dst="licenses", src=self._source_subfolder)
-        cmake = self._configure_cmake()
-        cmake.install()
+        if self.options.plugins_only:
+            # install target would build everything
+            for plugin_option, values in self._grpc_plugins.items():
+                if self.options.get_safe(plugin_option):
+                    for executable in [values["executable"], "{}.exe".format(values["executable"])]:
+                        self.copy(executable, dst="bin", src=os.path.join(self._build_subfolder, "bin"))
+            if self.options.shared:
+                self.copy("*grpc_plugin_support*.so*", dst="lib", src=os.path.join(self._build_subfolder, "lib"), symlinks=True)
+                self.copy("*grpc_plugin_support*.dylib", dst="lib", src=os.path.join(self._build_subfolder, "lib"), symlinks=True)
+                self.copy("*grpc_plugin_support*.dll", dst="bin", src=self._build_subfolder, keep_path=False)
+        else:
+            cmake = self._configure_cmake()
+            cmake.install()
 
-        tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
-        tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+            tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+            tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
 
         # Create one custom module file per executable in order to emulate
         # CMake executables imported targets of grpc
@@ -401,11 +469,13 @@ class grpcConan(ConanFile):
 
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "gRPC")
-        ssl_roots_file_path = os.path.join(self.package_folder, "res", "grpc", "roots.pem")
-        self.runenv_info.define_path("GRPC_DEFAULT_SSL_ROOTS_FILE_PATH", ssl_roots_file_path)
-        self.env_info.GRPC_DEFAULT_SSL_ROOTS_FILE_PATH = ssl_roots_file_path # remove in conan v2?
+        if not self.options.plugins_only:
+            ssl_roots_file_path = os.path.join(self.package_folder, "res", "grpc", "roots.pem")
+            self.runenv_info.define_path("GRPC_DEFAULT_SSL_ROOTS_FILE_PATH", ssl_roots_file_path)
+            self.env_info.GRPC_DEFAULT_SSL_ROOTS_FILE_PATH = ssl_roots_file_path # remove in conan v2?
 
-        for component, values in self._grpc_components.items():
+        grpc_components = {} if self.options.plugins_only else self._grpc_components
+        for component, values in grpc_components.items():
             target = values.get("lib")
             lib = values.get("lib")
             self.cpp_info.components[component].set_property("cmake_target_name", "gRPC::{}".format(target))
@@ -429,7 +499,7 @@ class grpcConan(ConanFile):
                 grpc_modules.append(os.path.join(self._module_path, grpc_module_filename))
         self.cpp_info.set_property("cmake_build_modules", grpc_modules)
 
-        if any(self.options.get_safe(plugin_option) for plugin_option in self._grpc_plugins.keys()):
+        if self.options.qps_benchmark or any(self.options.get_safe(plugin_option) for plugin_option in self._grpc_plugins.keys()):
             bindir = os.path.join(self.package_folder, "bin")
             self.output.info("Appending PATH environment variable: {}".format(bindir))
             self.env_info.PATH.append(bindir)
@@ -440,3 +510,10 @@ class grpcConan(ConanFile):
         if grpc_modules:
             self.cpp_info.components["grpc_execs"].build_modules["cmake_find_package"] = grpc_modules
             self.cpp_info.components["grpc_execs"].build_modules["cmake_find_package_multi"] = grpc_modules
+        if self.options.plugins_only:
+            # gRPC's CMake configuration needs all of them, even if only the plugins are built.
+            # Without library components, grpc_execs has to consume them.
+            self.cpp_info.components["grpc_execs"].requires = [
+                "abseil::abseil", "c-ares::c-ares", "openssl::openssl", "re2::re2", "zlib::zlib",
+                "protobuf::protobuf", "googleapis::googleapis", "grpc-proto::grpc-proto",
+            ]
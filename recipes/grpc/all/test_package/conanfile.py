@@ -29,6 +29,8 @@ class TestPackageConan(ConanFile):
         # should be fixed by using: CMakeToolchain + VirtualBuildEnv
         if tools.cross_building(self) and self.options["grpc"].shared:
             return
+        if self.options["grpc"].plugins_only:
+            return
         with self._buildenv():
             cmake = CMake(self)
             # FIXME: This combination of settings randomly fails in CI
@@ -39,6 +41,21 @@ class TestPackageConan(ConanFile):
             cmake.build()
 
     def test(self):
+        if self.options["grpc"].plugins_only:
+            if not tools.cross_building(self) and self.options["grpc"].cpp_plugin:
+                plugin = os.path.join(self.deps_cpp_info["grpc"].rootpath, "bin", "grpc_cpp_plugin")
+                if self.settings.os == "Windows":
+                    plugin += ".exe"
+                self.run("protoc --plugin=protoc-gen-grpc={} --grpc_out=. --proto_path={} helloworld.proto".format(
+                         plugin, self.source_folder), run_environment=True)
+                assert os.path.isfile("helloworld.grpc.pb.h")
+            return
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+        if self.options["grpc"].qps_benchmark:
+            # --help exits with a non-zero code, so only check that the tools are packaged
+            for executable in ["qps_worker", "qps_json_driver"]:
+                if self.settings.os == "Windows":
+                    executable += ".exe"
+                assert os.path.isfile(os.path.join(self.deps_cpp_info["grpc"].rootpath, "bin", executable))
@@ -17,10 +17,12 @@ class HighwayConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_contrib": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_contrib": True,
     }
     generators = "cmake"
 
@@ -48,6 +50,10 @@ class HighwayConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # hwy_contrib can only be disabled since HWY_ENABLE_CONTRIB (1.0.0),
+        # and doesn't exist before 0.12.1
+        if tools.Version(self.version) < "1.0.0":
+            del self.options.with_contrib
 
     def configure(self):
         if tools.Version(self.version) < "0.16.0":
@@ -90,6 +96,8 @@ class HighwayConan(ConanFile):
         cmake = CMake(self)
         cmake.definitions["BUILD_TESTING"] = False
         cmake.definitions["HWY_ENABLE_EXAMPLES"] = False
+        if "with_contrib" in self.options:
+            cmake.definitions["HWY_ENABLE_CONTRIB"] = self.options.with_contrib
         cmake.configure()
         return cmake
 
@@ -104,13 +112,23 @@ class HighwayConan(ConanFile):
         cmake.install()
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
 
-    def package_info(self):
-        self.cpp_info.names["pkg_config"] = "libhwy"
+    @property
+    def _has_contrib(self):
+        return tools.Version(self.version) >= "0.12.1" and self.options.get_safe("with_contrib", True)
 
-        self.cpp_info.libs = ["hwy"]
-        if tools.Version(self.version) >= "0.12.1":
-            self.cpp_info.libs.append("hwy_contrib")
-        if tools.Version(self.version) >= "0.15.0":
-            self.cpp_info.libs.append("hwy_test")
+    def package_info(self):
+        # hwy
+        self.cpp_info.components["hwy"].names["pkg_config"] = "libhwy"
+        self.cpp_info.components["hwy"].libs = ["hwy"]
         if tools.Version(self.version) >= "0.16.0":
-            self.cpp_info.defines.append("HWY_SHARED_DEFINE" if self.options.shared else "HWY_STATIC_DEFINE")
+            self.cpp_info.components["hwy"].defines.append("HWY_SHARED_DEFINE" if self.options.shared else "HWY_STATIC_DEFINE")
+        # hwy_contrib (VQSort, dot, image, math)
+        if self._has_contrib:
+            self.cpp_info.components["hwy_contrib"].names["pkg_config"] = "libhwy-contrib"
+            self.cpp_info.components["hwy_contrib"].libs = ["hwy_contrib"]
+            self.cpp_info.components["hwy_contrib"].requires = ["hwy"]
+        # hwy_test
+        if tools.Version(self.version) >= "0.15.0":
+            self.cpp_info.components["hwy_test"].names["pkg_config"] = "libhwy-test"
+            self.cpp_info.components["hwy_test"].libs = ["hwy_test"]
+            self.cpp_info.components["hwy_test"].requires = ["hwy"]
@@ -1,13 +1,19 @@
+// Compiles test_package.cpp once per target in HWY_TARGETS
+#undef HWY_TARGET_INCLUDE
+#define HWY_TARGET_INCLUDE "test_package.cpp"
+#include "hwy/foreach_target.h"
+
 #include "hwy/aligned_allocator.h"
 #include "hwy/highway.h"
 
 #include <iostream>
 
 HWY_BEFORE_NAMESPACE();
-namespace {
+namespace test_package {
 namespace HWY_NAMESPACE {
 
-void test()
+// Returns the target this function was compiled for
+int64_t test()
 {
     const HWY_FULL(uint32_t) d;
 
@@ -32,14 +38,39 @@ void test()
     }
 
     std::cout << "result = " << result << ", expected = " << expected << '\n';
+    return HWY_TARGET;
 }
 
 } // namespace HWY_NAMESPACE
-} // namespace
+} // namespace test_package
 HWY_AFTER_NAMESPACE();
 
+#if HWY_ONCE
+namespace test_package {
+
+HWY_EXPORT(test);
+
+void report_targets()
+{
+    const auto supported = hwy::SupportedTargets();
+
+    std::cout << "compiled targets:";
+    for (int64_t targets = HWY_TARGETS; targets != 0; targets &= targets - 1) {
+        const int64_t target = targets & -targets;
+        std::cout << ' ' << hwy::TargetName(target)
+                  << ((supported & target) ? "" : " (unavailable)");
+    }
+    std::cout << '\n';
+    std::cout << "static target: " << hwy::TargetName(HWY_STATIC_TARGET) << '\n';
+}
+
+} // namespace test_package
+
 int main()
 {
-    HWY_NAMESPACE::test();
+    test_package::report_targets();
+    const int64_t dispatched = HWY_DYNAMIC_DISPATCH(test_package::test)();
+    std::cout << "dispatched target: " << hwy::TargetName(dispatched) << '\n';
     return 0;
 }
+#endif // HWY_ONCE
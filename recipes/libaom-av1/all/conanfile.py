@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.files import apply_conandata_patches, copy, get, rmdir
@@ -21,13 +22,32 @@ class LibaomAv1Conan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "assembly": [True, False],
+        "encoder": [True, False],
+        "decoder": [True, False],
+        "realtime_only": [True, False],
+        "with_sse4_1": [True, False],
+        "with_sse4_2": [True, False],
+        "with_avx": [True, False],
+        "with_avx2": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "assembly": False,
+        "encoder": True,
+        "decoder": True,
+        "realtime_only": False,
+        "with_sse4_1": True,
+        "with_sse4_2": True,
+        "with_avx": True,
+        "with_avx2": True,
     }
 
+    @property
+    def _x86_isa_options(self):
+        # in increasing order, libaom disables all the following flavors when one is disabled
+        return ["with_sse4_1", "with_sse4_2", "with_avx", "with_avx2"]
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -41,10 +61,15 @@ class LibaomAv1Conan(ConanFile):
             del self.options.fPIC
         if self.settings.arch not in ("x86", "x86_64"):
             del self.options.assembly
+            for isa_option in self._x86_isa_options:
+                delattr(self.options, isa_option)
 
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.get_safe("assembly", True):
+            for isa_option in self._x86_isa_options:
+                delattr(self.options, isa_option)
         try:
             del self.settings.compiler.libcxx
         except Exception:
@@ -54,6 +79,15 @@ class LibaomAv1Conan(ConanFile):
         except Exception:
             pass
 
+    def validate(self):
+        if not self.options.encoder and not self.options.decoder:
+            raise ConanInvalidConfiguration("At least one of encoder or decoder must be enabled")
+        if self.options.realtime_only and not self.options.encoder:
+            raise ConanInvalidConfiguration("realtime_only requires encoder=True")
+        for lower, higher in zip(self._x86_isa_options, self._x86_isa_options[1:]):
+            if self.options.get_safe(higher) and self.options.get_safe(lower) is not None and not self.options.get_safe(lower):
+                raise ConanInvalidConfiguration("{} requires {}".format(higher, lower))
+
     def build_requirements(self):
         if self.options.get_safe("assembly", False):
             self.tool_requires("nasm/2.15.05")
@@ -76,6 +110,12 @@ class LibaomAv1Conan(ConanFile):
         if not self.options.get_safe("assembly", False):
             # make non-assembly build
             tc.variables["AOM_TARGET_CPU"] = "generic"
+        else:
+            for isa_option in self._x86_isa_options:
+                tc.variables["ENABLE_{}".format(isa_option[len("with_"):].upper())] = self.options.get_safe(isa_option)
+        tc.variables["CONFIG_AV1_ENCODER"] = 1 if self.options.encoder else 0
+        tc.variables["CONFIG_AV1_DECODER"] = 1 if self.options.decoder else 0
+        tc.variables["CONFIG_REALTIME_ONLY"] = 1 if self.options.realtime_only else 0
         # libyuv is used for examples, tests and non-essential 'dump_obu' tool so it is disabled
         # required to be 1/0 instead of False
         tc.variables["CONFIG_LIBYUV"] = 0
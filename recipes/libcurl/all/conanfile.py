@@ -48,6 +48,8 @@ class LibcurlConan(ConanFile):
         "with_libmetalink": [True, False],
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
+        "max_write_size": "ANY",
+        "default_conncache_size": "ANY",
         "with_nghttp2": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
@@ -92,6 +94,8 @@ class LibcurlConan(ConanFile):
         "with_libmetalink": False,
         "with_libpsl": False,
         "with_largemaxwritesize": False,
+        "max_write_size": None,
+        "default_conncache_size": None,
         "with_nghttp2": False,
         "with_zlib": True,
         "with_brotli": False,
@@ -164,6 +168,10 @@ class LibcurlConan(ConanFile):
             del self.options.with_libmetalink
         # Default options
         self.options.with_ssl = "darwinssl" if is_apple_os(self) else "openssl"
+        # c-ares resolves asynchronously in the calling thread instead of spawning one thread per lookup
+        if self.settings.os == "Linux":
+            self.options.with_c_ares = True
+            self.options.with_threaded_resolver = False
 
     def configure(self):
         if self.options.shared:
@@ -205,6 +213,17 @@ class LibcurlConan(ConanFile):
         if self.options.with_ssl == "openssl":
             if self.options.with_ntlm and self.options["openssl"].no_des:
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl:no_des=False")
+        if self.options.max_write_size:
+            if self.options.with_largemaxwritesize:
+                raise ConanInvalidConfiguration("with_largemaxwritesize and max_write_size can't be used together")
+            if not self._is_positive_integer(self.options.max_write_size):
+                raise ConanInvalidConfiguration("max_write_size must be a positive integer (in bytes)")
+        if self.options.default_conncache_size and not self._is_positive_integer(self.options.default_conncache_size):
+            raise ConanInvalidConfiguration("default_conncache_size must be a positive integer")
+
+    @staticmethod
+    def _is_positive_integer(value):
+        return str(value).isdigit() and int(str(value)) > 0
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -251,6 +270,15 @@ class LibcurlConan(ConanFile):
             replace_in_file(self, os.path.join(self._source_subfolder, "include", "curl", "curl.h"),
                                   "define CURL_MAX_WRITE_SIZE 16384",
                                   "define CURL_MAX_WRITE_SIZE 10485760")
+        elif self.options.max_write_size:
+            replace_in_file(self, os.path.join(self._source_subfolder, "include", "curl", "curl.h"),
+                                  "define CURL_MAX_WRITE_SIZE 16384",
+                                  "define CURL_MAX_WRITE_SIZE {}".format(self.options.max_write_size))
+
+        if self.options.default_conncache_size:
+            replace_in_file(self, os.path.join(self._source_subfolder, "lib", "urldata.h"),
+                                  "#define DEFAULT_CONNCACHE_SIZE 5",
+                                  "#define DEFAULT_CONNCACHE_SIZE {}".format(self.options.default_conncache_size))
 
         # https://github.com/curl/curl/issues/2835
         # for additional info, see this comment https://github.com/conan-io/conan-center-index/pull/1008#discussion_r386122685
@@ -371,7 +399,8 @@ class LibcurlConan(ConanFile):
             "--enable-tftp={}".format(yes_no(self.options.with_tftp)),
             "--enable-debug={}".format(yes_no(self.settings.build_type == "Debug")),
             "--enable-ares={}".format(yes_no(self.options.with_c_ares)),
-            "--enable-threaded-resolver={}".format(yes_no(self.options.with_threaded_resolver)),
+            # c-ares and the threaded resolver are mutually exclusive, c-ares takes precedence (as in CMake build)
+            "--enable-threaded-resolver={}".format(yes_no(self.options.with_threaded_resolver and not self.options.with_c_ares)),
             "--enable-cookies={}".format(yes_no(self.options.with_cookies)),
             "--enable-ipv6={}".format(yes_no(self.options.with_ipv6)),
             "--enable-manual={}".format(yes_no(self.options.with_docs)),
@@ -1,5 +1,6 @@
 from conan.tools.microsoft import msvc_runtime_flag, is_msvc
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 import functools
 
@@ -20,12 +21,22 @@ class LibeventConan(ConanFile):
         "fPIC": [True, False],
         "with_openssl": [True, False],
         "disable_threads": [True, False],
+        "disable_clock_gettime": [True, False],
+        "disable_mm_replacement": [True, False],
+        "disable_select": [True, False],
+        "disable_poll": [True, False],
+        "with_benchmarks": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_openssl": True,
         "disable_threads": False,
+        "disable_clock_gettime": False,
+        "disable_mm_replacement": False,
+        "disable_select": False,
+        "disable_poll": False,
+        "with_benchmarks": False,
     }
 
     generators = "cmake", "cmake_find_package"
@@ -48,6 +59,9 @@ class LibeventConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # win32 backend is always built
+            del self.options.disable_select
+            del self.options.disable_poll
 
     def configure(self):
         if self.options.shared:
@@ -59,6 +73,15 @@ class LibeventConan(ConanFile):
         if self.options.with_openssl:
             self.requires("openssl/1.1.1q")
 
+    @property
+    def _benchmarks(self):
+        return ["bench", "bench_cascade", "bench_http", "bench_httpclient"]
+
+    def validate(self):
+        if self.options.get_safe("disable_select") and self.options.get_safe("disable_poll") and \
+           self.settings.os not in ["Linux", "Android", "FreeBSD", "Macos", "iOS", "watchOS", "tvOS"]:
+            raise ConanInvalidConfiguration("libevent needs select or poll backend on {} (no epoll nor kqueue)".format(self.settings.os))
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version], destination=self._source_subfolder, strip_root=True)
 
@@ -79,7 +102,14 @@ class LibeventConan(ConanFile):
         cmake.definitions["EVENT__DISABLE_DEBUG_MODE"] = self.settings.build_type == "Release"
         cmake.definitions["EVENT__DISABLE_OPENSSL"] = not self.options.with_openssl
         cmake.definitions["EVENT__DISABLE_THREAD_SUPPORT"] = self.options.disable_threads
-        cmake.definitions["EVENT__DISABLE_BENCHMARK"] = True
+        cmake.definitions["EVENT__DISABLE_CLOCK_GETTIME"] = self.options.disable_clock_gettime
+        cmake.definitions["EVENT__DISABLE_MM_REPLACEMENT"] = self.options.disable_mm_replacement
+        # Backends are built if their function is detected, a cached result skips the check
+        if self.options.get_safe("disable_select"):
+            cmake.definitions["EVENT__HAVE_SELECT"] = False
+        if self.options.get_safe("disable_poll"):
+            cmake.definitions["EVENT__HAVE_POLL"] = False
+        cmake.definitions["EVENT__DISABLE_BENCHMARK"] = not self.options.with_benchmarks
         cmake.definitions["EVENT__DISABLE_TESTS"] = True
         cmake.definitions["EVENT__DISABLE_REGRESS"] = True
         cmake.definitions["EVENT__DISABLE_SAMPLES"] = True
@@ -99,6 +129,12 @@ class LibeventConan(ConanFile):
         self.copy("LICENSE", src=self._source_subfolder, dst="licenses")
         cmake = self._configure_cmake()
         cmake.install()
+        if self.options.with_benchmarks:
+            # not installed by libevent, in <config>/ subfolder with multi-config generators
+            bench_dir = os.path.join(self._build_subfolder, self._source_subfolder, "bin")
+            for bench in self._benchmarks:
+                for pattern in [bench, "{}.exe".format(bench), "*/{}.exe".format(bench)]:
+                    self.copy(pattern, src=bench_dir, dst="bin", keep_path=False)
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
         tools.rmdir(os.path.join(self.package_folder, "cmake"))
@@ -24,3 +24,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["libevent"].with_benchmarks:
+                self.run("bench -n 100 -a 10 -w 1000", run_environment=True)
@@ -1,7 +1,8 @@
 from conan import ConanFile
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rmdir, save
 from conan.tools.microsoft import is_msvc, check_min_vs
+from conan.tools.scm import Version
 import os
 import textwrap
 
@@ -20,10 +21,12 @@ class LibuvConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_benchmarks": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_benchmarks": False,
     }
 
     def export_sources(self):
@@ -32,6 +35,9 @@ class LibuvConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # uv_run_benchmarks_a target appeared in 1.38.0
+        if Version(self.version) < "1.38.0":
+            del self.options.with_benchmarks
 
     def configure(self):
         if self.options.shared:
@@ -61,14 +67,31 @@ class LibuvConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["LIBUV_BUILD_TESTS"] = False
+        # uv_run_benchmarks_a is only defined with the tests
+        tc.variables["LIBUV_BUILD_TESTS"] = self.options.get_safe("with_benchmarks", False)
+        tc.variables["LIBUV_BUILD_BENCH"] = self.options.get_safe("with_benchmarks", False)
+        if self.options.get_safe("with_benchmarks"):
+            # Don't build the whole test suite for install
+            tc.variables["CMAKE_SKIP_INSTALL_ALL_DEPENDENCY"] = True
         tc.generate()
 
-    def build(self):
+    def _patch_sources(self):
         apply_conandata_patches(self)
+        if self.options.get_safe("with_benchmarks"):
+            # uv_a target is removed by our patches, uv is static or shared depending on shared option
+            replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
+                            "target_link_libraries(uv_run_benchmarks_a uv_a",
+                            "target_link_libraries(uv_run_benchmarks_a uv")
+
+    def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
-        cmake.build()
+        if self.options.get_safe("with_benchmarks"):
+            cmake.build(target="uv")
+            cmake.build(target="uv_run_benchmarks_a")
+        else:
+            cmake.build()
 
     def package(self):
         for license_file in ["LICENSE", "LICENSE-docs"]:
@@ -78,6 +101,10 @@ class LibuvConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
+        if self.options.get_safe("with_benchmarks"):
+            # in <config>/ subfolder with multi-config generators
+            for bench in ["*uv_run_benchmarks_a", "*uv_run_benchmarks_a.exe"]:
+                copy(self, bench, src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
 
         # TODO: to remove in conan v2 once cmake_find_package* generators removed
         self._create_cmake_module_alias_targets(
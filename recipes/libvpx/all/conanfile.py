@@ -21,16 +21,25 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "runtime_cpu_detect": [True, False],
+        "multithread": [True, False],
+        "vp9_highbitdepth": [True, False],
+        "realtime_only": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "runtime_cpu_detect": True,
+        "multithread": True,
+        "vp9_highbitdepth": True,
+        "realtime_only": False,
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
 
     options.update({name: [True, False] for name in _arch_options})
-    default_options.update({name: 'avx' not in name for name in _arch_options})
+    # the kernels are selected at runtime with runtime_cpu_detect, avx512 needs a recent toolchain
+    default_options.update({name: name != 'avx512' for name in _arch_options})
 
     @property
     def _source_subfolder(self):
@@ -48,6 +57,8 @@ class LibVPXConan(ConanFile):
         if self.settings.os == 'Windows':
             del self.options.fPIC
         if str(self.settings.arch) not in ['x86', 'x86_64']:
+            # arm_cpudetect.c has no runtime detection for most arm targets (e.g. macOS/M1)
+            del self.options.runtime_cpu_detect
             for name in self._arch_options:
                 delattr(self.options, name)
 
@@ -62,13 +73,17 @@ class LibVPXConan(ConanFile):
             raise ConanInvalidConfiguration("Unsupported compiler {}.".format(self.settings.compiler))
         if self.settings.os == "Macos" and self.settings.arch == "armv8" and tools.Version(self.version) < "1.10.0":
             raise ConanInvalidConfiguration("M1 only supported since 1.10, please upgrade")
+        for lower, higher in zip(self._arch_options, self._arch_options[1:]):
+            if self.options.get_safe(higher) and self.options.get_safe(lower) is not None and not self.options.get_safe(lower):
+                raise ConanInvalidConfiguration("Option {} requires {} (libvpx disables all the following extensions)".format(higher, lower))
 
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
     def build_requirements(self):
-        self.build_requires("yasm/1.3.0")
+        if str(self.settings.arch) in ['x86', 'x86_64']:
+            self.build_requires("yasm/1.3.0")
         if self._settings_build.os == "Windows" and not tools.get_env("CONAN_BASH_PATH"):
             self.build_requires("msys2/cci.latest")
 
@@ -101,9 +116,15 @@ class LibVPXConan(ConanFile):
             "--disable-unit-tests",
             "--disable-tools",
             "--disable-docs",
-            "--enable-vp9-highbitdepth",
-            "--as=yasm",
+            "--{}-multithread".format("enable" if self.options.multithread else "disable"),
+            "--{}-vp9-highbitdepth".format("enable" if self.options.vp9_highbitdepth else "disable"),
         ]
+        if self.options.get_safe("runtime_cpu_detect") is not None:
+            args.append("--{}-runtime-cpu-detect".format("enable" if self.options.runtime_cpu_detect else "disable"))
+        if self.options.realtime_only:
+            args.append("--enable-realtime-only")
+        if str(self.settings.arch) in ["x86", "x86_64"]:
+            args.append("--as=yasm")
         if self.options.shared:
             args.extend(['--disable-static', '--enable-shared'])
         else:
@@ -1,5 +1,6 @@
 from conan.tools.files import rename
 from conans import ConanFile, tools, AutoToolsBuildEnvironment
+from conans.errors import ConanInvalidConfiguration
 import contextlib
 import os
 
@@ -20,11 +21,19 @@ class LibX264Conan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "bit_depth": [8, 10, "all"],
+        "with_asm": [True, False],
+        "with_threads": [True, False],
+        "enable_lto": [True, False],
+        "with_cli": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "bit_depth": "all",
+        "with_asm": True,
+        "with_threads": True,
+        "enable_lto": False,
+        "with_cli": False,
     }
 
     _autotools = None
@@ -54,7 +63,12 @@ class LibX264Conan(ConanFile):
 
     @property
     def _with_nasm(self):
-        return self.settings.arch in ("x86", "x86_64")
+        return self.options.with_asm and self.settings.arch in ("x86", "x86_64")
+
+    @property
+    def _nasm_min_version(self):
+        # minimum version accepted by x264 configure
+        return "2.13"
 
     def build_requirements(self):
         if self._with_nasm:
@@ -87,9 +101,19 @@ class LibX264Conan(ConanFile):
         extra_ldflags = []
         args = [
             "--bit-depth=%s" % str(self.options.bit_depth),
-            "--disable-cli",
             "--prefix={}".format(tools.unix_path(self.package_folder)),
         ]
+        if self.options.with_cli:
+            # don't pick up optional input/output libraries from the system
+            args.extend(["--disable-lavf", "--disable-swscale", "--disable-ffms", "--disable-gpac", "--disable-lsmash"])
+        else:
+            args.append("--disable-cli")
+        if not self.options.with_asm:
+            args.append("--disable-asm")
+        if not self.options.with_threads:
+            args.append("--disable-thread")
+        if self.options.enable_lto:
+            args.append("--enable-lto")
         if self.options.shared:
             args.append("--enable-shared")
         else:
@@ -140,7 +164,16 @@ class LibX264Conan(ConanFile):
         self._autotools.configure(args=args, vars=self._override_env, configure_dir=self._source_subfolder, build=build_canonical_name, host=host_canonical_name)
         return self._autotools
 
+    def _check_nasm_version(self):
+        # x264 configure suggests --disable-asm with an old nasm, never build without asm by accident
+        nasm_version = self.dependencies.build["nasm"].ref.version
+        if tools.Version(nasm_version) < self._nasm_min_version:
+            raise ConanInvalidConfiguration("libx264 with_asm=True requires nasm >= {}, found {}".format(
+                self._nasm_min_version, nasm_version))
+
     def build(self):
+        if self._with_nasm:
+            self._check_nasm_version()
         with self._build_context():
             # relocatable shared lib on macOS
             tools.replace_in_file(os.path.join(self._source_subfolder, "configure"),
@@ -170,5 +203,10 @@ class LibX264Conan(ConanFile):
         elif self.settings.os == "Android":
             self.cpp_info.system_libs.extend(["dl", "m"])
 
+        if self.options.with_cli:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
+
         # TODO: to remove in conan v2 once pkg_config generator removed
         self.cpp_info.names["pkg_config"] = "x264"
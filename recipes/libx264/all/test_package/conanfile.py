@@ -24,3 +24,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["libx264"].with_cli:
+                self.run("x264 --version", run_environment=True)
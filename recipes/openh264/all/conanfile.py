@@ -1,8 +1,9 @@
 from conan.tools.microsoft import msvc_runtime_flag
 from conans import ConanFile, tools, AutoToolsBuildEnvironment
+from conans.errors import ConanInvalidConfiguration
 import os
 
-required_conan_version = ">=1.33.0"
+required_conan_version = ">=1.38.0"
 
 
 class OpenH264Conan(ConanFile):
@@ -17,10 +18,12 @@ class OpenH264Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_asm": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_asm": True,
     }
 
     @property
@@ -35,6 +38,15 @@ class OpenH264Conan(ConanFile):
     def _is_clang_cl(self):
         return self.settings.os == 'Windows' and self.settings.compiler == 'clang'
 
+    @property
+    def _with_nasm(self):
+        return self.options.with_asm and self.settings.arch in ("x86", "x86_64")
+
+    @property
+    def _nasm_min_version(self):
+        # AVX2 kernels
+        return "2.10"
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -52,7 +64,7 @@ class OpenH264Conan(ConanFile):
             del self.options.fPIC
 
     def build_requirements(self):
-        if self.settings.arch in ("x86", "x86_64"):
+        if self._with_nasm:
             self.build_requires("nasm/2.15.05")
         if self._settings_build.os == "Windows" and not tools.get_env("CONAN_BASH_PATH"):
             self.build_requires("msys2/cci.latest")
@@ -117,6 +129,7 @@ class OpenH264Conan(ConanFile):
         args = [
             "ARCH={}".format(self._make_arch),
             "PREFIX={}".format(prefix),
+            "USE_ASM={}".format("Yes" if self.options.with_asm else "No"),
         ]
         autotools = AutoToolsBuildEnvironment(self)
         if self._is_msvc:
@@ -152,7 +165,15 @@ class OpenH264Conan(ConanFile):
 
         return args
 
+    def _check_nasm_version(self):
+        nasm_version = self.dependencies.build["nasm"].ref.version
+        if tools.Version(nasm_version) < self._nasm_min_version:
+            raise ConanInvalidConfiguration("openh264 with_asm=True requires nasm >= {}, found {}".format(
+                self._nasm_min_version, nasm_version))
+
     def build(self):
+        if self._with_nasm:
+            self._check_nasm_version()
         self._patch_sources()
         with tools.vcvars(self) if (self._is_msvc or self._is_clang_cl) else tools.no_op():
             with tools.chdir(self._source_subfolder):
@@ -1,9 +1,125 @@
 #include <wels/codec_api.h>
+
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define WIDTH 640
+#define HEIGHT 360
+#define FRAMES 60
+#define SLICES 4
+
+static double now(void)
+{
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+}
+
+/* moving gradient, so that every frame has to be encoded */
+static void fill_frame(unsigned char *yuv, int index)
+{
+    unsigned char *u = yuv + WIDTH * HEIGHT;
+    unsigned char *v = u + WIDTH * HEIGHT / 4;
+    int x, y;
+
+    for (y = 0; y < HEIGHT; ++y) {
+        for (x = 0; x < WIDTH; ++x) {
+            yuv[y * WIDTH + x] = (unsigned char)(x + y + index * 3);
+        }
+    }
+    for (y = 0; y < HEIGHT / 2; ++y) {
+        for (x = 0; x < WIDTH / 2; ++x) {
+            u[y * WIDTH / 2 + x] = (unsigned char)(128 + x - index);
+            v[y * WIDTH / 2 + x] = (unsigned char)(128 + y + index);
+        }
+    }
+}
 
 int main()
 {
     OpenH264Version version = WelsGetCodecVersion();
+    ISVCEncoder *encoder = NULL;
+    SEncParamExt param;
+    SSourcePicture picture;
+    SFrameBSInfo info;
+    unsigned char *yuv;
+    long total_bytes = 0;
+    double start, elapsed;
+    int i;
+
     printf("OpenH264 version: %d.%d.%d\n", version.uMajor, version.uMinor, version.uRevision);
+
+    if (WelsCreateSVCEncoder(&encoder) != 0 || encoder == NULL) {
+        printf("WelsCreateSVCEncoder failed\n");
+        return 1;
+    }
+
+    memset(&param, 0, sizeof(param));
+    (*encoder)->GetDefaultParams(encoder, &param);
+    param.iUsageType = CAMERA_VIDEO_REAL_TIME;
+    param.fMaxFrameRate = 30.f;
+    param.iPicWidth = WIDTH;
+    param.iPicHeight = HEIGHT;
+    param.iTargetBitrate = 1000000;
+    param.iRCMode = RC_BITRATE_MODE;
+    param.iSpatialLayerNum = 1;
+    param.iMultipleThreadIdc = SLICES;
+    param.sSpatialLayers[0].iVideoWidth = WIDTH;
+    param.sSpatialLayers[0].iVideoHeight = HEIGHT;
+    param.sSpatialLayers[0].fFrameRate = 30.f;
+    param.sSpatialLayers[0].iSpatialBitrate = param.iTargetBitrate;
+    param.sSpatialLayers[0].sSliceArgument.uiSliceMode = SM_FIXEDSLCNUM_SLICE;
+    param.sSpatialLayers[0].sSliceArgument.uiSliceNum = SLICES;
+    if ((*encoder)->InitializeExt(encoder, &param) != cmResultSuccess) {
+        printf("InitializeExt failed\n");
+        WelsDestroySVCEncoder(encoder);
+        return 1;
+    }
+
+    yuv = malloc(WIDTH * HEIGHT * 3 / 2);
+    if (yuv == NULL) {
+        (*encoder)->Uninitialize(encoder);
+        WelsDestroySVCEncoder(encoder);
+        return 1;
+    }
+    memset(&picture, 0, sizeof(picture));
+    picture.iPicWidth = WIDTH;
+    picture.iPicHeight = HEIGHT;
+    picture.iColorFormat = videoFormatI420;
+    picture.iStride[0] = WIDTH;
+    picture.iStride[1] = picture.iStride[2] = WIDTH / 2;
+    picture.pData[0] = yuv;
+    picture.pData[1] = yuv + WIDTH * HEIGHT;
+    picture.pData[2] = picture.pData[1] + WIDTH * HEIGHT / 4;
+
+    elapsed = 0.;
+    for (i = 0; i < FRAMES; ++i) {
+        fill_frame(yuv, i);
+        picture.uiTimeStamp = i * 1000 / 30;
+        memset(&info, 0, sizeof(info));
+        start = now();
+        if ((*encoder)->EncodeFrame(encoder, &picture, &info) != cmResultSuccess) {
+            printf("EncodeFrame failed at frame %d\n", i);
+            free(yuv);
+            (*encoder)->Uninitialize(encoder);
+            WelsDestroySVCEncoder(encoder);
+            return 1;
+        }
+        elapsed += now() - start;
+        total_bytes += info.iFrameSizeInBytes;
+    }
+
+    free(yuv);
+    (*encoder)->Uninitialize(encoder);
+    WelsDestroySVCEncoder(encoder);
+
+    if (total_bytes == 0) {
+        printf("no bitstream produced\n");
+        return 1;
+    }
+    printf("encoded %d frames %dx%d with %d slices: %ld bytes, %.1f fps\n",
+           FRAMES, WIDTH, HEIGHT, SLICES, total_bytes, elapsed > 0 ? FRAMES / elapsed : 0.);
     return 0;
 }
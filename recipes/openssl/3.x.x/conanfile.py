@@ -25,6 +25,8 @@ class OpenSSLConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "enable_weak_ssl_ciphers": [True, False],
+        "enable_ktls": [True, False],
+        "enable_ec_nistp_64_gcc_128": [True, False],
         "386": [True, False],
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
@@ -136,6 +138,14 @@ class OpenSSLConan(ConanFile):
         if self.settings.os == "Emscripten":
             if not all((self.options.no_asm, self.options.no_threads, self.options.no_stdio)):
                 raise ConanInvalidConfiguration("os=Emscripten requires openssl:{no_asm,no_threads,no_stdio}=True")
+        if self.options.enable_ktls and self.settings.os not in ("Linux", "FreeBSD"):
+            raise ConanInvalidConfiguration("openssl:enable_ktls=True is only supported on Linux and FreeBSD")
+        if self.options.enable_ec_nistp_64_gcc_128:
+            # requires __uint128_t support and a little endian 64-bit target
+            if self.settings.compiler not in ("gcc", "clang", "apple-clang") or self._is_clangcl:
+                raise ConanInvalidConfiguration("openssl:enable_ec_nistp_64_gcc_128=True requires gcc or clang")
+            if self.settings.arch not in ("x86_64", "armv8", "armv8.3", "ppc64le"):
+                raise ConanInvalidConfiguration("openssl:enable_ec_nistp_64_gcc_128=True requires a 64-bit little endian architecture")
 
     @property
     def _is_clangcl(self):
@@ -411,6 +421,9 @@ class OpenSSLConan(ConanFile):
 
         args.append("no-fips" if self.options.get_safe("no_fips", True) else "enable-fips")
         args.append("no-md2" if self.options.get_safe("no_md2", True) else "enable-md2")
+        if self.options.enable_ec_nistp_64_gcc_128:
+            # underscores are part of the Configure feature name
+            args.append("enable-ec_nistp_64_gcc_128")
 
         if self.settings.os == "Neutrino":
             args.append("no-asm -lsocket -latomic")
@@ -439,7 +452,7 @@ class OpenSSLConan(ConanFile):
             ])
 
         for option_name in self.options.values.fields:
-            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2"):
+            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2", "enable_ec_nistp_64_gcc_128"):
                 self.output.info(f"Activated option: {option_name}")
                 args.append(option_name.replace("_", "-"))
         return args
@@ -748,6 +761,10 @@ class OpenSSLConan(ConanFile):
             self.cpp_info.components["crypto"].system_libs.append("atomic")
             self.cpp_info.components["ssl"].system_libs.append("atomic")
 
+        bin_path = os.path.join(self.package_folder, "bin")
+        self.output.info("Appending PATH environment variable: {}".format(bin_path))
+        self.env_info.PATH.append(bin_path)
+
         self.cpp_info.components["crypto"].set_property("cmake_target_name", "OpenSSL::Crypto")
         self.cpp_info.components["crypto"].set_property("pkg_config_name", "libcrypto")
         self.cpp_info.components["ssl"].set_property("cmake_target_name", "OpenSSL::SSL")
@@ -18,6 +18,7 @@ class TestPackageConan(ConanFile):
         cmake.definitions["OPENSSL_WITH_LEGACY"] = self._with_legacy()
         cmake.definitions["OPENSSL_WITH_MD4"] = not self.options["openssl"].no_md4
         cmake.definitions["OPENSSL_WITH_RIPEMD160"] = not self.options["openssl"].no_rmd160
+        cmake.definitions["OPENSSL_WITH_ASM"] = not self.options["openssl"].no_asm
         if self.settings.os == "Android":
             cmake.definitions["CONAN_LIBCXX"] = ""
         cmake.configure()
@@ -32,8 +33,16 @@ class TestPackageConan(ConanFile):
                 bin_legacy_path = os.path.join("bin", "digest_legacy")
                 self.run(bin_legacy_path, run_environment=True)
 
+            # reports which accelerated code paths (AES-NI, VAES, SHA-NI...) are dispatched at runtime
+            bin_cpu_features_path = os.path.join("bin", "cpu_features")
+            self.run(bin_cpu_features_path, run_environment=True)
+
             if not self.options["openssl"].no_stdio:
-                self.run("openssl version", run_environment=True)
+                self.run("openssl version -a", run_environment=True)
+            if not self.options["openssl"].no_stdio and tools.get_env("OPENSSL_TEST_SPEED", False):
+                # opt-in smoke benchmark: a single block size for one second per algorithm
+                self.run("openssl speed -seconds 1 -bytes 16384 -evp aes-256-gcm", run_environment=True)
+                self.run("openssl speed -seconds 1 -bytes 16384 sha256", run_environment=True)
         assert os.path.exists(os.path.join(self.deps_cpp_info["openssl"].rootpath, "licenses", "LICENSE.txt"))
 
         for fn in ("libcrypto.pc", "libssl.pc", "openssl.pc",):
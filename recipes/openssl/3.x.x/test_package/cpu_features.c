@@ -0,0 +1,70 @@
+#include <openssl/crypto.h>
+
+#include <stdio.h>
+#include <string.h>
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+#define TEST_PACKAGE_X86 1
+#endif
+
+#if defined(TEST_PACKAGE_X86)
+/*
+ * OPENSSL_ia32cap is reported as two 64-bit words:
+ *   - first: CPUID(1).EDX | CPUID(1).ECX << 32
+ *   - second: CPUID(7).EBX | CPUID(7).ECX << 32
+ * OpenSSL clears the bits of features which are not usable, so this is what the dispatcher sees.
+ */
+struct ia32cap_feature {
+    const char *name;
+    int word;
+    int bit;
+};
+
+static const struct ia32cap_feature features[] = {
+    {"SSSE3", 0, 32 + 9},
+    {"PCLMULQDQ", 0, 32 + 1},
+    {"AES-NI", 0, 32 + 25},
+    {"AVX", 0, 32 + 28},
+    {"AVX2", 1, 5},
+    {"SHA-NI", 1, 29},
+    {"AVX512F", 1, 16},
+    {"VAES", 1, 32 + 9},
+    {"VPCLMULQDQ", 1, 32 + 10},
+};
+#endif
+
+int main()
+{
+    const char *cpu_settings = OPENSSL_info(OPENSSL_INFO_CPU_SETTINGS);
+
+    if (cpu_settings == NULL) {
+#if defined(TEST_PACKAGE_X86) && defined(OPENSSL_WITH_ASM)
+        printf("ERROR: OpenSSL was built with assembly but reports no CPU capabilities\n");
+        return 1;
+#else
+        printf("OpenSSL CPU settings: none (generic C code paths)\n");
+        return 0;
+#endif
+    }
+
+    printf("OpenSSL CPU settings: %s\n", cpu_settings);
+
+#if defined(TEST_PACKAGE_X86)
+    {
+        unsigned long long words[2] = {0, 0};
+        const char *value = strchr(cpu_settings, '=');
+        size_t i;
+
+        if (value == NULL || sscanf(value + 1, "0x%llx:0x%llx", &words[0], &words[1]) != 2) {
+            printf("ERROR: unexpected OPENSSL_ia32cap format\n");
+            return 1;
+        }
+        for (i = 0; i < sizeof(features) / sizeof(features[0]); ++i) {
+            int active = (int)((words[features[i].word] >> features[i].bit) & 1);
+            printf("  %-12s %s\n", features[i].name, active ? "active" : "not active");
+        }
+    }
+#endif
+
+    return 0;
+}
@@ -0,0 +1,91 @@
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include <google/protobuf/arena.h>
+
+#if defined(BENCHMARK_LITE)
+#include "benchmark_lite.pb.h"
+namespace bench = benchmark_lite;
+static const char *runtime = "lite";
+#else
+#include "benchmark.pb.h"
+namespace bench = benchmark;
+static const char *runtime = "full";
+#endif
+
+static void fill(bench::Batch &batch)
+{
+	for (int i = 0; i < 16; ++i) {
+		bench::Sample *sample = batch.add_samples();
+		sample->set_timestamp(1660000000000LL + i);
+		sample->set_source("conan-center-index/protobuf/" + std::to_string(i));
+		for (int j = 0; j < 32; ++j) {
+			sample->add_values(i * 0.5 + j);
+		}
+		sample->add_tags("host=localhost");
+		sample->add_tags("shard=" + std::to_string(i % 4));
+		sample->set_payload(std::string(64, static_cast<char>('a' + i)));
+	}
+}
+
+int main(int argc, char **argv)
+{
+	const long iterations = argc > 1 ? std::atol(argv[1]) : 20000;
+
+	bench::Batch batch;
+	fill(batch);
+	const std::string reference = batch.SerializeAsString();
+
+	std::string buffer;
+	auto start = std::chrono::steady_clock::now();
+	for (long i = 0; i < iterations; ++i) {
+		buffer.clear();
+		batch.SerializeToString(&buffer);
+	}
+	const std::chrono::duration<double> serialize_time = std::chrono::steady_clock::now() - start;
+
+	bench::Batch parsed;
+	start = std::chrono::steady_clock::now();
+	for (long i = 0; i < iterations; ++i) {
+		if (!parsed.ParseFromString(reference)) {
+			std::cerr << "parse error\n";
+			return EXIT_FAILURE;
+		}
+	}
+	const std::chrono::duration<double> parse_time = std::chrono::steady_clock::now() - start;
+
+	// Same parse loop with the messages allocated on an arena, reset after each iteration
+	std::vector<char> initial_block(4 * reference.size());
+	google::protobuf::ArenaOptions arena_options;
+	arena_options.initial_block = initial_block.data();
+	arena_options.initial_block_size = initial_block.size();
+	google::protobuf::Arena arena(arena_options);
+	start = std::chrono::steady_clock::now();
+	for (long i = 0; i < iterations; ++i) {
+		bench::Batch *arena_parsed = google::protobuf::Arena::CreateMessage<bench::Batch>(&arena);
+		if (!arena_parsed->ParseFromString(reference)) {
+			std::cerr << "arena parse error\n";
+			return EXIT_FAILURE;
+		}
+		arena.Reset();
+	}
+	const std::chrono::duration<double> arena_parse_time = std::chrono::steady_clock::now() - start;
+
+	if (parsed.SerializeAsString() != reference) {
+		std::cerr << "round trip mismatch\n";
+		return EXIT_FAILURE;
+	}
+
+	const double megabytes = static_cast<double>(reference.size()) * iterations / (1024. * 1024.);
+	std::cout << "protobuf " << runtime << " runtime, " << iterations << " x " << reference.size() << " bytes\n";
+	std::cout << "  serialize: " << megabytes / serialize_time.count() << " MiB/s, "
+	          << iterations / serialize_time.count() << " msg/s\n";
+	std::cout << "  parse:     " << megabytes / parse_time.count() << " MiB/s, "
+	          << iterations / parse_time.count() << " msg/s\n";
+	std::cout << "  parse (arena): " << megabytes / arena_parse_time.count() << " MiB/s, "
+	          << iterations / arena_parse_time.count() << " msg/s\n";
+	return EXIT_SUCCESS;
+}
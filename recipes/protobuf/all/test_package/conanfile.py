@@ -22,3 +22,6 @@ class TestPackageConan(ConanFile):
         if not cross_building(self):
             self.run("protoc --version", run_environment=True)
             self.run(os.path.join("bin", "test_package"), run_environment=True)
+            self.run(os.path.join("bin", "benchmark"), run_environment=True)
+            if self.options["protobuf"].lite:
+                self.run(os.path.join("bin", "benchmark_lite"), run_environment=True)
@@ -80,11 +80,10 @@ class PulseAudioConan(ConanFile):
             raise ConanInvalidConfiguration("pulseaudio supports only linux currently")
 
         if self.options.get_safe("with_fftw"):
-            fftw_precision = self.dependencies["fftw"].options.precision
-            if fftw_precision != "single":
+            if not self.dependencies["fftw"].options.precision_single:
                 raise ConanInvalidConfiguration(
-                    f"Pulse audio cannot use fftw {fftw_precision} precision. "
-                    "Either set option fftw:precision=single or pulseaudio:with_fftw=False"
+                    "Pulse audio requires fftw single precision. "
+                    "Either set option fftw:precision_single=True or pulseaudio:with_fftw=False"
                 )
 
     def build_requirements(self):
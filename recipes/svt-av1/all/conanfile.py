@@ -0,0 +1,123 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.env import VirtualBuildEnv
+from conan.tools.files import copy, get, rm, rmdir
+import os
+
+required_conan_version = ">=1.47.0"
+
+
+class SvtAv1Conan(ConanFile):
+    name = "svt-av1"
+    description = "Scalable Video Technology for AV1 (SVT-AV1 Encoder and Decoder)"
+    topics = ("av1", "codec", "video", "encoding", "decoding")
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://gitlab.com/AOMediaCodec/SVT-AV1"
+    license = "BSD-3-Clause-Clear"
+
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "build_encoder": [True, False],
+        "build_decoder": [True, False],
+        "with_tools": [True, False],
+        "assembly": [True, False],
+        "with_avx512": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "build_encoder": True,
+        "build_decoder": True,
+        "with_tools": False,
+        "assembly": True,
+        "with_avx512": False,
+    }
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+        if self.settings.arch not in ("x86", "x86_64"):
+            del self.options.assembly
+        if self.settings.arch != "x86_64":
+            del self.options.with_avx512
+
+    def configure(self):
+        if self.options.shared:
+            del self.options.fPIC
+        try:
+            del self.settings.compiler.libcxx
+        except Exception:
+            pass
+        try:
+            del self.settings.compiler.cppstd
+        except Exception:
+            pass
+        if not self.options.get_safe("assembly", True):
+            del self.options.with_avx512
+
+    def validate(self):
+        if not self.options.build_encoder and not self.options.build_decoder:
+            raise ConanInvalidConfiguration("At least one of build_encoder or build_decoder must be enabled")
+        if self.settings.arch not in ("x86", "x86_64", "armv8"):
+            raise ConanInvalidConfiguration("SVT-AV1 only supports x86, x86_64 and armv8")
+
+    def build_requirements(self):
+        if self.options.get_safe("assembly", False):
+            self.tool_requires("nasm/2.15.05")
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version],
+            destination=self.source_folder, strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.variables["BUILD_TESTING"] = False
+        tc.variables["BUILD_ENC"] = self.options.build_encoder
+        tc.variables["BUILD_DEC"] = self.options.build_decoder
+        tc.variables["BUILD_APPS"] = self.options.with_tools
+        if self.settings.arch in ("x86", "x86_64"):
+            tc.variables["COMPILE_C_ONLY"] = not self.options.assembly
+            tc.variables["ENABLE_NASM"] = self.options.assembly
+        if self.options.get_safe("with_avx512") is not None:
+            tc.variables["ENABLE_AVX512"] = self.options.with_avx512
+        tc.generate()
+        env = VirtualBuildEnv(self)
+        env.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE*.md", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        copy(self, "PATENTS.md", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rm(self, "*.pdb", os.path.join(self.package_folder, "bin"))
+
+    def package_info(self):
+        if self.options.build_encoder:
+            self.cpp_info.components["encoder"].set_property("pkg_config_name", "SvtAv1Enc")
+            self.cpp_info.components["encoder"].libs = ["SvtAv1Enc"]
+            self.cpp_info.components["encoder"].includedirs = ["include/svt-av1"]
+            if self.settings.os in ("FreeBSD", "Linux"):
+                self.cpp_info.components["encoder"].system_libs = ["pthread", "dl", "m"]
+        if self.options.build_decoder:
+            self.cpp_info.components["decoder"].set_property("pkg_config_name", "SvtAv1Dec")
+            self.cpp_info.components["decoder"].libs = ["SvtAv1Dec"]
+            self.cpp_info.components["decoder"].includedirs = ["include/svt-av1"]
+            if self.settings.os in ("FreeBSD", "Linux"):
+                self.cpp_info.components["decoder"].system_libs = ["pthread", "dl", "m"]
+
+        if self.options.with_tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
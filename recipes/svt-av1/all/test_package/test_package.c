@@ -0,0 +1,35 @@
+#ifdef TEST_ENCODER
+#include <EbSvtAv1Enc.h>
+#endif
+#ifdef TEST_DECODER
+#include <EbSvtAv1Dec.h>
+#endif
+
+#include <stdio.h>
+
+int main()
+{
+    EbComponentType *handle = NULL;
+
+#ifdef TEST_ENCODER
+    EbSvtAv1EncConfiguration enc_config;
+    if (svt_av1_enc_init_handle(&handle, NULL, &enc_config) != EB_ErrorNone) {
+        printf("svt_av1_enc_init_handle failed\n");
+        return 1;
+    }
+    printf("SVT-AV1 encoder version: %s, logical processors: %u\n",
+           svt_av1_get_version(), enc_config.logical_processors);
+    svt_av1_enc_deinit_handle(handle);
+#endif
+
+#ifdef TEST_DECODER
+    EbSvtAv1DecConfiguration dec_config;
+    if (svt_av1_dec_init_handle(&handle, NULL, &dec_config) != EB_ErrorNone) {
+        printf("svt_av1_dec_init_handle failed\n");
+        return 1;
+    }
+    printf("SVT-AV1 decoder version: %s\n", svt_av1_get_version());
+    svt_av1_dec_deinit_handle(handle);
+#endif
+    return 0;
+}
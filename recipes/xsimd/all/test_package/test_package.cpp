@@ -3,13 +3,41 @@
 
 namespace xs = xsimd;
 
+#if XSIMD_VERSION_MAJOR >= 8
+struct arch_name {
+  template <class Arch>
+  const char *operator()(Arch) const { return Arch::name(); }
+};
+
+// Reports architectures compiled in this binary, which of them the CPU supports,
+// and the one selected by runtime dispatch
+void report_architectures() {
+  const unsigned best = xs::available_architectures().best;
+  std::cout << "compiled architectures:";
+  xs::supported_architectures::for_each([best](auto arch) {
+    std::cout << ' ' << arch.name() << (decltype(arch)::version() <= best ? "" : " (unavailable)");
+  });
+  std::cout << std::endl;
+  std::cout << "default architecture: " << xs::default_arch::name() << std::endl;
+  std::cout << "dispatched architecture: " << xs::dispatch(arch_name{})() << std::endl;
+}
+#endif
+
 int main(int argc, char *argv[]) {
 #if XSIMD_VERSION_MAJOR < 8
   xs::batch<double, 4> a(1.5, 2.5, 3.5, 4.5);
   xs::batch<double, 4> b(2.5, 3.5, 4.5, 5.5);
 #else
-  xs::batch<double> a({1.5, 2.5, 3.5, 4.5});
-  xs::batch<double> b({2.5, 3.5, 4.5, 5.5});
+  // batch size depends on the architecture (8 doubles with AVX-512)
+  double a_data[xs::batch<double>::size];
+  double b_data[xs::batch<double>::size];
+  for (std::size_t i = 0; i < xs::batch<double>::size; ++i) {
+    a_data[i] = 1.5 + i;
+    b_data[i] = 2.5 + i;
+  }
+  auto a = xs::batch<double>::load_unaligned(a_data);
+  auto b = xs::batch<double>::load_unaligned(b_data);
+  report_architectures();
 #endif
 
   auto mean = (a + b) / 2;